@@ -7,16 +7,19 @@ Loads and replays recorded robot movements from PPR format files.
 import time
 import threading
 import logging
-from typing import Optional, Dict, List, Any
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Tuple, Any
 from pathlib import Path
 
-try:
+if TYPE_CHECKING:
+    # Only needed for annotations; the interface object is passed in
     from piper_sdk import C_PiperInterface_V2
-except ImportError:
-    # For testing without SDK
-    C_PiperInterface_V2 = None
 
-from ppr_file_handler import read_ppr_file, get_recording_info
+from ppr_file_handler import (
+    load_recording_arrays_cached,
+    build_recording_info,
+    get_trim_range,
+    RecordingArrays
+)
 
 
 # Constants
@@ -30,6 +33,11 @@ COMMAND_INTERVAL = 0.005  # 5ms = 200 Hz
 # 1000 = 1.0 N·m, matching the official piper_ctrl_gripper.py demo default.
 GRIPPER_PLAYBACK_EFFORT = 1000
 
+# on_progress fires each time playback advances by 1/PROGRESS_STEPS (1 %),
+# but no more often than every PROGRESS_MIN_INTERVAL seconds
+PROGRESS_STEPS = 100
+PROGRESS_MIN_INTERVAL = 0.1
+
 
 class PiperPlayer:
     """
@@ -43,14 +51,28 @@ class PiperPlayer:
     - Thread-safe operation
     """
     
-    def __init__(self, piper_interface: 'C_PiperInterface_V2'):
+    def __init__(
+        self,
+        piper_interface: 'C_PiperInterface_V2',
+        on_progress: Optional[Callable[[float, int, int], None]] = None,
+        on_complete: Optional[Callable[[], None]] = None
+    ):
         """
         Initialize the player with a Piper SDK interface.
         
+        Callbacks are invoked from the playback thread.
+        
         Args:
             piper_interface: Connected Piper robot interface instance
+            on_progress: Callback when progress advances by 1/PROGRESS_STEPS (1 %),
+                         at most every PROGRESS_MIN_INTERVAL seconds
+                         (progress_percent, current_sample, total_samples)
+            on_complete: Callback when the playback thread finishes
+                         (completed, stopped or failed)
         """
         self.piper = piper_interface
+        self.on_progress = on_progress
+        self.on_complete = on_complete
         
         # State variables
         self._is_playing = False
@@ -60,9 +82,12 @@ class PiperPlayer:
         self._pause_event = threading.Event()
         
         # Loaded data
-        self._data_list: List[Dict[str, Any]] = []
+        self._arrays: Optional[RecordingArrays] = None  # Every sample in the loaded file, as playback columns
+        self._start_index = 0  # First sample to play (after trimming)
+        self._end_index = 0  # One past the last sample to play
         self._metadata: Dict[str, Any] = {}
         self._current_filepath: Optional[Path] = None
+        self._current_filename = ""  # Cached _current_filepath.name for status
         
         # Playback parameters
         self._speed_multiplier = DEFAULT_SPEED_MULTIPLIER
@@ -116,14 +141,16 @@ class PiperPlayer:
         self.logger.info(f"Loading recording: {filepath}")
         
         try:
-            # Load and parse file
-            self._data_list, self._metadata = read_ppr_file(filepath)
+            # Load and parse file (shared with other players via the recording cache)
+            self._metadata, self._arrays = load_recording_arrays_cached(filepath)
+            self._start_index, self._end_index = 0, len(self._arrays)
             self._current_filepath = Path(filepath)
+            self._current_filename = self._current_filepath.name
             
-            # Get recording info
-            info = get_recording_info(filepath)
+            # Summarize from the data already in memory (don't re-read the file)
+            info = build_recording_info(filepath, self._arrays, self._metadata)
             
-            self.logger.info(f"Loaded {len(self._data_list)} samples, duration: {info['duration_sec']:.2f}s")
+            self.logger.info(f"Loaded {len(self._arrays)} samples, duration: {info['duration_sec']:.2f}s")
             
             return info
             
@@ -131,6 +158,42 @@ class PiperPlayer:
             self.logger.error(f"Failed to load recording: {e}")
             raise
     
+    def set_trim(self, trim_start: float = 0.0, trim_end: float = 0.0) -> int:
+        """
+        Restrict playback to the loaded recording minus the trimmed seconds.
+        
+        Can be called repeatedly; each call only moves the start/end indices
+        into the loaded recording, so nothing is re-read or copied.
+        
+        Args:
+            trim_start: Seconds to skip at the beginning of the recording
+            trim_end: Seconds to skip at the end of the recording
+        
+        Returns:
+            Number of samples that will be played
+        
+        Raises:
+            RuntimeError: If no recording is loaded or playback is in progress
+        """
+        if not self._arrays:
+            raise RuntimeError("No recording loaded. Load a file first.")
+        
+        if self._is_playing:
+            raise RuntimeError("Cannot change trim while playback is in progress")
+        
+        self._start_index, self._end_index = get_trim_range(
+            self._arrays.timestamps, trim_start, trim_end, self._metadata['time_multiplier']
+        )
+        self.logger.info(
+            f"Trim set: start={trim_start:.2f}s, end={trim_end:.2f}s "
+            f"({self._sample_count()} of {len(self._arrays)} samples)"
+        )
+        return self._sample_count()
+    
+    def _sample_count(self) -> int:
+        """Number of samples that will be played (after trimming)."""
+        return self._end_index - self._start_index
+    
     def start_playback(self, speed_multiplier: float = DEFAULT_SPEED_MULTIPLIER,
                       init_gripper: bool = True, init_robot: bool = True,
                       smooth_playback: bool = False) -> None:
@@ -149,7 +212,7 @@ class PiperPlayer:
         Raises:
             RuntimeError: If no recording is loaded or already playing
         """
-        if not self._data_list:
+        if not self._sample_count():
             raise RuntimeError("No recording loaded. Load a file first.")
         
         if self._is_playing:
@@ -248,13 +311,14 @@ class PiperPlayer:
         """
         self.logger.info("Playback loop started")
 
-        if not self._data_list:
+        if not self._sample_count():
             self.logger.error("No data to play back")
+            self._finish_playback()
             return
 
         # Use fixed rate like demos (0.005 seconds = 200 Hz)
-        # Adjust by speed multiplier
-        base_interval = 0.005  # 5ms between commands (like demo)
+        # Adjust by speed multiplier (re-read every frame so set_speed applies live)
+        base_interval = COMMAND_INTERVAL  # 5ms between commands (like demo)
         interval = base_interval / self._speed_multiplier
 
         self.logger.info(f"Playback interval: {interval*1000:.2f}ms ({1/interval:.1f} Hz)")
@@ -272,38 +336,75 @@ class PiperPlayer:
             self.logger.info("Motion control mode set (MOVE_J, CAN, 100% speed)")
         except Exception as e:
             self.logger.error(f"Failed to set motion control mode: {e}")
+            self._finish_playback()
             return
 
-        # Build the frame list, applying smooth-playback decimation if requested
+        # Pick the frames to play, applying smooth-playback decimation if requested
+        start_index = self._start_index
         if self._smooth_playback:
-            frame_list = list(enumerate(self._data_list))[::10]
+            frame_indices = range(start_index, self._end_index, 10)
             self.logger.info(
                 f"SmoothPlayback enabled: playing every 10th sample "
-                f"({len(frame_list)} of {len(self._data_list)} frames)"
+                f"({len(frame_indices)} of {self._sample_count()} frames)"
             )
         else:
-            frame_list = list(enumerate(self._data_list))
+            frame_indices = range(start_index, self._end_index)
+
+        # Bind everything the loop touches per frame to locals up front
+        joint_commands = self._arrays.joint_commands
+        gripper_commands = self._arrays.gripper_commands
+        send_position = self._send_position
+        stop_requested = self._stop_event.is_set
+        pause_requested = self._pause_event.is_set
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        on_progress = self.on_progress
+        total_samples = self._sample_count()
+        last_step = -1
+        next_progress_time = 0.0
 
         try:
-            for i, data_point in frame_list:
+            # Commands are scheduled against absolute deadlines, so the time
+            # spent sending each one doesn't add up into a slower playback
+            next_time = perf_counter()
+
+            for i in frame_indices:
                 # Check for stop signal
-                if self._stop_event.is_set():
+                if stop_requested():
                     self.logger.info("Playback stopped by user")
                     break
 
                 # Handle pause
-                while self._pause_event.is_set():
-                    time.sleep(0.1)
-                    if self._stop_event.is_set():
-                        break
+                if pause_requested():
+                    while pause_requested():
+                        sleep(0.1)
+                        if stop_requested():
+                            break
+                    next_time = perf_counter()
 
-                self._current_index = i
+                current = self._current_index = i - start_index
+
+                # Push progress only when it has moved on by a whole step
+                # (next_time is the frame's deadline, so no extra clock read)
+                if on_progress is not None and next_time >= next_progress_time:
+                    step = current * PROGRESS_STEPS // total_samples
+                    if step != last_step:
+                        last_step = step
+                        next_progress_time = next_time + PROGRESS_MIN_INTERVAL
+                        on_progress(current * 100.0 / total_samples, current, total_samples)
 
                 # Send position command to robot
-                self._send_position(data_point)
+                send_position(joint_commands[i], gripper_commands[i])
 
-                # Fixed delay between commands (like the demo)
-                time.sleep(interval)
+                # Fixed rate between commands (like the demo)
+                interval = base_interval / self._speed_multiplier
+                next_time += interval
+                delay = next_time - perf_counter()
+                if delay > 0:
+                    sleep(delay)
+                elif delay < -interval:
+                    # Fell more than a frame behind - resync instead of bursting
+                    next_time = perf_counter()
             
             self.logger.info("Playback completed successfully")
             
@@ -311,10 +412,19 @@ class PiperPlayer:
             self.logger.error(f"Error during playback: {e}")
         
         finally:
-            self._is_playing = False
-            self._is_paused = False
+            self._finish_playback()
+    
+    def _finish_playback(self) -> None:
+        """Reset playback state when the playback thread ends and notify on_complete."""
+        self._is_playing = False
+        self._is_paused = False
+        if self.on_complete:
+            try:
+                self.on_complete()
+            except Exception as e:
+                self.logger.error(f"on_complete callback failed: {e}")
     
-    def _send_position(self, data_point: Dict[str, Any]) -> None:
+    def _send_position(self, joint_command: Tuple[int, ...], gripper_command: int) -> None:
         """
         Send a position command to the robot.
 
@@ -324,19 +434,12 @@ class PiperPlayer:
         GripperCtrl, causing the gripper to be unresponsive during playback.
 
         Args:
-            data_point: Dictionary with cartesian, joints, and gripper data
+            joint_command: Six joint angles in SDK units (0.001 degrees)
+            gripper_command: Gripper position in SDK units (0.001 mm, >= 0)
         """
         try:
-            # Extract joint angles
-            joints = data_point['joints']
-            
-            # Convert from degrees to SDK units (0.001 degrees)
-            j1 = int(joints[0] * 1000)
-            j2 = int(joints[1] * 1000)
-            j3 = int(joints[2] * 1000)
-            j4 = int(joints[3] * 1000)
-            j5 = int(joints[4] * 1000)
-            j6 = int(joints[5] * 1000)
+            # Already in SDK units (converted once when the recording was loaded)
+            j1, j2, j3, j4, j5, j6 = joint_command
             
             # Debug: Log first few commands to verify values
             if self._current_index < 5:
@@ -345,20 +448,18 @@ class PiperPlayer:
             # Send joint control command
             self.piper.JointCtrl(j1, j2, j3, j4, j5, j6)
             
-            # Extract gripper position from the recording.
-            gripper = data_point['gripper']
-            gripper_pos = int(gripper['position'] * 1000)  # mm -> 0.001 mm (SDK units)
-
             # Use a fixed torque limit, NOT the recorded effort value.
             # The recorded effort is *measured* torque feedback (near-zero when
             # moving freely). GripperCtrl takes a torque *limit* instead — using
             # the measured value as a limit would leave the gripper unable to move.
             # GRIPPER_PLAYBACK_EFFORT = 1000 (1.0 N·m), matching the SDK demo.
+            # Arguments are positional (gripper_angle, gripper_effort,
+            # gripper_code, set_zero) - this runs for every frame.
             self.piper.GripperCtrl(
-                gripper_angle=abs(gripper_pos),
-                gripper_effort=GRIPPER_PLAYBACK_EFFORT,
-                gripper_code=0x03,  # enable + clear errors
-                set_zero=0x00
+                gripper_command,
+                GRIPPER_PLAYBACK_EFFORT,
+                0x03,  # enable + clear errors
+                0x00
             )
             
         except Exception as e:
@@ -373,6 +474,24 @@ class PiperPlayer:
         """
         return self._is_playing
     
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until playback finishes or the timeout expires.
+        
+        Returns as soon as the playback thread ends, so callers polling for
+        completion don't add up to a full poll interval of latency.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            True if playback is no longer running
+        """
+        thread = self._playback_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        return not self._is_playing
+    
     def is_paused(self) -> bool:
         """
         Check if playback is paused.
@@ -389,10 +508,20 @@ class PiperPlayer:
         Returns:
             Progress as percentage (0.0 to 100.0)
         """
-        if not self._data_list:
+        if not self._sample_count():
             return 0.0
         
-        return (self._current_index / len(self._data_list)) * 100.0
+        return (self._current_index / self._sample_count()) * 100.0
+    
+    def get_sample_position(self) -> Tuple[int, int]:
+        """
+        Get the current sample and total sample count without building
+        the full playback info dict (for callers polling during playback).
+        
+        Returns:
+            Tuple of (current_sample, total_samples)
+        """
+        return self._current_index, self._sample_count()
     
     def get_playback_info(self) -> Dict[str, Any]:
         """
@@ -401,17 +530,17 @@ class PiperPlayer:
         Returns:
             Dictionary with playback stats
         """
-        if not self._data_list:
+        total_samples = self._sample_count()
+        if not total_samples:
             return {'loaded': False}
         
-        total_samples = len(self._data_list)
         progress_pct = (self._current_index / total_samples * 100.0) if total_samples > 0 else 0.0
         
         return {
             'loaded': True,
             'is_playing': self._is_playing,
             'is_paused': self._is_paused,
-            'filename': self._current_filepath.name if self._current_filepath else "",
+            'filename': self._current_filename,
             'total_samples': total_samples,
             'current_sample': self._current_index,
             'progress_percent': progress_pct,
@@ -438,7 +567,7 @@ class PiperPlayer:
         Returns:
             True if a recording is loaded and ready to play
         """
-        return len(self._data_list) > 0
+        return self._sample_count() > 0
 
 
 # Example usage and testing
@@ -7,9 +7,18 @@ File format: t<epoch_ms> x<X> y<Y> z<Z> a<RX> b<RY> c<RZ> J6[j1,j2,j3,j4,j5,j6]
 
 import os
 import re
+import json
+import time
+import atexit
+import bisect
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
 
 
 # Constants
@@ -21,6 +30,30 @@ DEFAULT_METADATA = {
     "sample_rate_hz": 200
 }
 
+# Read recordings in large chunks (default buffering refills every 8 KB)
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Parsed recordings kept in memory (shared by all players), bounded by their
+# total sample count rather than the number of files. Cached columns take
+# about 270 bytes per sample, so 10 minutes at 200 Hz is roughly 33 MB.
+RECORDING_CACHE_MAX_SAMPLES = 200 * 60 * 10
+
+# Worker threads used to summarize many recordings at once
+INFO_MAX_WORKERS = 8
+
+# Recording info cache (persisted next to the recordings)
+INFO_CACHE_FILENAME = ".info_cache.json"
+INFO_CACHE_SAVE_INTERVAL = 2.0  # Minimum seconds between cache writes
+
+_recording_cache: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], RecordingArrays]]" = OrderedDict()
+_recording_cache_lock = threading.Lock()
+_recording_cache_samples = 0
+
+_info_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_info_cache_lock = threading.Lock()
+_info_cache_dirty = False
+_info_cache_last_save = 0.0
+
 
 def create_ppr_filename() -> str:
     """
@@ -94,27 +127,23 @@ def write_ppr_header(file_handle, metadata: Optional[Dict[str, Any]] = None) ->
     file_handle.write(";\n")
 
 
-def write_ppr_line(
-    file_handle,
+def format_ppr_line(
     timestamp: int,
     cartesian: Dict[str, float],
     joints: List[float],
     gripper: Dict[str, float]
-) -> None:
+) -> str:
     """
-    Write a single data line to the PPR file.
+    Format a single data line for a PPR file (including the newline).
     
     Args:
-        file_handle: Open file handle for writing
         timestamp: Epoch timestamp in milliseconds
         cartesian: Dictionary with keys: x, y, z, a, b, c (mm and degrees)
         joints: List of 6 joint angles in degrees [j1, j2, j3, j4, j5, j6]
         gripper: Dictionary with keys: position, effort, code
     
-    Example:
-        cartesian = {'x': 150.523, 'y': -50.342, 'z': 180.0, 'a': -179.9, 'b': 0.0, 'c': -179.9}
-        joints = [0.0, 45.0, -30.0, 0.0, 0.0, 0.0]
-        gripper = {'position': 80.0, 'effort': 1.5, 'code': 1}
+    Returns:
+        The formatted line
     """
     # Format cartesian coordinates
     x = cartesian.get('x', 0.0)
@@ -132,16 +161,48 @@ def write_ppr_line(
     grp_eff = gripper.get('effort', 0.0)
     grp_code = int(gripper.get('code', 0))
     
-    # Write line in G-code-like format
-    line = (
+    # Line in G-code-like format
+    return (
         f"t{timestamp} "
         f"x{x:.3f} y{y:.3f} z{z:.3f} "
         f"a{a:.3f} b{b:.3f} c{c:.3f} "
         f"J6[{j1:.3f},{j2:.3f},{j3:.3f},{j4:.3f},{j5:.3f},{j6:.3f}] "
         f"Grp[{grp_pos:.3f},{grp_eff:.3f},{grp_code}]\n"
     )
+
+
+def write_ppr_line(
+    file_handle,
+    timestamp: int,
+    cartesian: Dict[str, float],
+    joints: List[float],
+    gripper: Dict[str, float]
+) -> None:
+    """
+    Write a single data line to the PPR file.
+    
+    Args:
+        file_handle: Open file handle for writing
+        timestamp: Epoch timestamp in milliseconds
+        cartesian: Dictionary with keys: x, y, z, a, b, c (mm and degrees)
+        joints: List of 6 joint angles in degrees [j1, j2, j3, j4, j5, j6]
+        gripper: Dictionary with keys: position, effort, code
     
-    file_handle.write(line)
+    Example:
+        cartesian = {'x': 150.523, 'y': -50.342, 'z': 180.0, 'a': -179.9, 'b': 0.0, 'c': -179.9}
+        joints = [0.0, 45.0, -30.0, 0.0, 0.0, 0.0]
+        gripper = {'position': 80.0, 'effort': 1.5, 'code': 1}
+    """
+    file_handle.write(format_ppr_line(timestamp, cartesian, joints, gripper))
+
+
+# Whole-line pattern for the layout written by format_ppr_line; matching it
+# once is much cheaper than searching for each field separately
+_PPR_LINE_RE = re.compile(
+    r't(\d+) x([-\d.]+) y([-\d.]+) z([-\d.]+) '
+    r'a([-\d.]+) b([-\d.]+) c([-\d.]+) '
+    r'J6\[([-\d.,]+)\] Grp\[([-\d.,]+)\]'
+)
 
 
 def parse_ppr_line(line: str) -> Optional[Dict[str, Any]]:
@@ -168,45 +229,59 @@ def parse_ppr_line(line: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        # Parse timestamp
-        timestamp_match = re.search(r't(\d+)', line)
-        if not timestamp_match:
-            return None
-        timestamp = int(timestamp_match.group(1))
-        
-        # Parse cartesian coordinates
-        x_match = re.search(r'x([-\d.]+)', line)
-        y_match = re.search(r'y([-\d.]+)', line)
-        z_match = re.search(r'z([-\d.]+)', line)
-        a_match = re.search(r'a([-\d.]+)', line)
-        b_match = re.search(r'b([-\d.]+)', line)
-        c_match = re.search(r'c([-\d.]+)', line)
-        
-        cartesian = {
-            'x': float(x_match.group(1)) if x_match else 0.0,
-            'y': float(y_match.group(1)) if y_match else 0.0,
-            'z': float(z_match.group(1)) if z_match else 0.0,
-            'a': float(a_match.group(1)) if a_match else 0.0,
-            'b': float(b_match.group(1)) if b_match else 0.0,
-            'c': float(c_match.group(1)) if c_match else 0.0,
-        }
+        # Fast path: lines in the layout written by format_ppr_line
+        match = _PPR_LINE_RE.match(line)
+        if match:
+            t, x, y, z, a, b, c, joint_str, gripper_str = match.groups()
+            timestamp = int(t)
+            cartesian = {
+                'x': float(x), 'y': float(y), 'z': float(z),
+                'a': float(a), 'b': float(b), 'c': float(c),
+            }
+        else:
+            # Parse timestamp
+            timestamp_match = re.search(r't(\d+)', line)
+            if not timestamp_match:
+                return None
+            timestamp = int(timestamp_match.group(1))
+            
+            # Parse cartesian coordinates
+            x_match = re.search(r'x([-\d.]+)', line)
+            y_match = re.search(r'y([-\d.]+)', line)
+            z_match = re.search(r'z([-\d.]+)', line)
+            a_match = re.search(r'a([-\d.]+)', line)
+            b_match = re.search(r'b([-\d.]+)', line)
+            c_match = re.search(r'c([-\d.]+)', line)
+            
+            cartesian = {
+                'x': float(x_match.group(1)) if x_match else 0.0,
+                'y': float(y_match.group(1)) if y_match else 0.0,
+                'z': float(z_match.group(1)) if z_match else 0.0,
+                'a': float(a_match.group(1)) if a_match else 0.0,
+                'b': float(b_match.group(1)) if b_match else 0.0,
+                'c': float(c_match.group(1)) if c_match else 0.0,
+            }
+            
+            # Parse joint array J6[...]
+            joint_match = re.search(r'J6\[([-\d.,]+)\]', line)
+            if not joint_match:
+                return None
+            joint_str = joint_match.group(1)
+            
+            # Parse gripper array Grp[...]
+            gripper_match = re.search(r'Grp\[([-\d.,]+)\]', line)
+            if not gripper_match:
+                return None
+            gripper_str = gripper_match.group(1)
         
-        # Parse joint array J6[...]
-        joint_match = re.search(r'J6\[([-\d.,]+)\]', line)
-        if not joint_match:
-            return None
-        joint_values = joint_match.group(1).split(',')
+        joint_values = joint_str.split(',')
         joints = [float(v) for v in joint_values[:6]]
         
         # Ensure we have exactly 6 joints
         while len(joints) < 6:
             joints.append(0.0)
         
-        # Parse gripper array Grp[...]
-        gripper_match = re.search(r'Grp\[([-\d.,]+)\]', line)
-        if not gripper_match:
-            return None
-        gripper_values = gripper_match.group(1).split(',')
+        gripper_values = gripper_str.split(',')
         
         gripper = {
             'position': float(gripper_values[0]) if len(gripper_values) > 0 else 0.0,
@@ -226,93 +301,650 @@ def parse_ppr_line(line: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def read_ppr_file(filepath: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+def _parse_header_line(line: str, metadata: Dict[str, Any]) -> None:
     """
-    Read and parse a complete PPR file.
+    Extract metadata from a header comment line into metadata.
+    """
+    if 'Version:' in line:
+        metadata['version'] = line.split('Version:')[1].strip()
+    elif 'Sample Rate:' in line:
+        rate_str = line.split('Sample Rate:')[1].strip().split()[0]
+        metadata['sample_rate_hz'] = int(rate_str)
+    elif 'Created:' in line:
+        metadata['created'] = line.split('Created:')[1].strip()
+    elif 'Description:' in line:
+        metadata['description'] = line.split('Description:')[1].strip()
+
+
+def iter_ppr_file(filepath: str, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a PPR file one sample at a time.
+    
+    Use this instead of read_ppr_file when the samples don't all need to be
+    in memory at once (e.g. to summarize a recording).
     
     Args:
         filepath: Path to the .ppr file
+        metadata: Optional dictionary that is filled in with the header
+                  metadata as the file is read
     
-    Returns:
-        Tuple of (data_list, metadata):
-            - data_list: List of parsed data dictionaries (one per line)
-            - metadata: Dictionary of metadata from header
+    Yields:
+        Parsed data dictionaries (see parse_ppr_line), in file order
     
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file format is invalid
     """
-    file_path = Path(filepath)
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"Recording file not found: {filepath}")
+    if metadata is None:
+        metadata = {}
     
-    data_list = []
-    metadata = {}
+    # Let open() report a missing file instead of checking exists() first
+    try:
+        f = open(filepath, 'r', buffering=READ_BUFFER_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Recording file not found: {filepath}") from None
     
-    with open(file_path, 'r') as f:
+    with f:
         for line in f:
             # Parse header metadata
             if line.startswith(';'):
-                # Extract metadata from comments
-                if 'Version:' in line:
-                    metadata['version'] = line.split('Version:')[1].strip()
-                elif 'Sample Rate:' in line:
-                    rate_str = line.split('Sample Rate:')[1].strip().split()[0]
-                    metadata['sample_rate_hz'] = int(rate_str)
-                elif 'Created:' in line:
-                    metadata['created'] = line.split('Created:')[1].strip()
-                elif 'Description:' in line:
-                    metadata['description'] = line.split('Description:')[1].strip()
+                _parse_header_line(line, metadata)
                 continue
             
             # Parse data line
             parsed_data = parse_ppr_line(line)
             if parsed_data:
-                data_list.append(parsed_data)
+                yield parsed_data
+
+
+def read_ppr_file(filepath: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Read and parse a complete PPR file.
+    
+    Args:
+        filepath: Path to the .ppr file
+    
+    Returns:
+        Tuple of (data_list, metadata):
+            - data_list: List of parsed data dictionaries (one per line)
+            - metadata: Dictionary of metadata from header, plus
+              'time_multiplier' (timestamp units per second)
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+    """
+    metadata = {}
+    data_list = list(iter_ppr_file(filepath, metadata))
     
     if not data_list:
         raise ValueError(f"No valid data found in file: {filepath}")
     
+    # Timestamp units per second, derived once so consumers don't re-detect it
+    metadata['time_multiplier'] = detect_time_multiplier(data_list[0]['timestamp'])
+    
     return data_list, metadata
 
 
-def get_recording_info(filepath: str) -> Dict[str, Any]:
+def _recording_cache_key(filepath: str) -> Tuple[str, int, int]:
     """
-    Get summary information about a recording file without loading all data.
+    Build the (abspath, mtime_ns, size) key used by the recording caches.
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Recording file not found: {filepath}")
+    
+    return os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size
+
+
+def detect_time_multiplier(timestamp: int) -> int:
+    """
+    Determine how many timestamp units make up one second.
+    
+    The PPR format stores epoch milliseconds, but older or hand-made files
+    may use epoch seconds or microseconds. The unit is inferred from the
+    magnitude of an absolute timestamp (not from the span between two
+    timestamps, which is ambiguous for long recordings).
+    
+    Args:
+        timestamp: Any timestamp from the recording (usually the first)
+    
+    Returns:
+        1 for seconds, 1000 for milliseconds, 1_000_000 for microseconds
+    """
+    if timestamp >= 10**14:
+        return 1_000_000  # Epoch microseconds
+    if 10**9 <= timestamp < 10**11:
+        return 1  # Epoch seconds
+    return 1000  # Epoch milliseconds (PPR default), or relative timestamps
+
+
+@dataclass
+class RecordingArrays:
+    """
+    Column-oriented copy of a recording, used on the playback hot path.
+    
+    read_ppr_file returns one nested dict per sample; indexing parallel lists
+    avoids the per-field dict lookups for every command sent to the robot.
+    Scalar columns are typed arrays (8 bytes per sample instead of a boxed
+    Python object each), and only the columns playback needs are kept.
+    
+    Attributes:
+        timestamps: Sample timestamps, array('q') (epoch ms)
+        joint_commands: Joint angles per sample in SDK units (0.001 degrees),
+            as 6-tuples of ints ready for JointCtrl
+        gripper_commands: Gripper position per sample in SDK units
+            (0.001 mm, absolute value) ready for GripperCtrl, array('q')
+    """
+    timestamps: Sequence[int]
+    joint_commands: List[Tuple[int, ...]]
+    gripper_commands: Sequence[int]
+    
+    def __len__(self) -> int:
+        """Number of samples."""
+        return len(self.timestamps)
+
+
+def to_recording_arrays(samples: Iterable[Dict[str, Any]]) -> RecordingArrays:
+    """
+    Convert parsed samples into a RecordingArrays.
+    
+    The samples are consumed one at a time, so passing iter_ppr_file builds
+    the columns without holding every parsed sample dict in memory.
+    
+    Args:
+        samples: Parsed samples, e.g. from iter_ppr_file or read_ppr_file
+    
+    Returns:
+        RecordingArrays with one entry per sample
+    """
+    timestamps = array('q')
+    joint_commands = []
+    gripper_commands = array('q')
+    
+    # Unit conversion done once here instead of for every command sent
+    for sample in samples:
+        timestamps.append(sample['timestamp'])
+        joint_commands.append(tuple(int(angle * 1000) for angle in sample['joints']))
+        gripper_commands.append(abs(int(sample['gripper']['position'] * 1000)))
+    
+    return RecordingArrays(
+        timestamps=timestamps,
+        joint_commands=joint_commands,
+        gripper_commands=gripper_commands,
+    )
+
+
+def _load_recording_arrays(filepath: str) -> Tuple[Dict[str, Any], RecordingArrays]:
+    """
+    Parse a recording straight into its column view (uncached).
+    """
+    metadata = {}
+    arrays = to_recording_arrays(iter_ppr_file(filepath, metadata))
+    
+    if not len(arrays):
+        raise ValueError(f"No valid data found in file: {filepath}")
+    
+    # Timestamp units per second, derived once so consumers don't re-detect it
+    metadata['time_multiplier'] = detect_time_multiplier(arrays.timestamps[0])
+    
+    return metadata, arrays
+
+
+def load_recording_arrays_cached(filepath: str) -> Tuple[Dict[str, Any], RecordingArrays]:
+    """
+    Read a PPR file into its column view through the recording cache.
+    
+    Timelines and node sequences play the same few files over and over; this
+    parses each file once and hands every caller the same objects, including
+    one shared set of playback columns. A modified file gets a new cache key,
+    so stale data is never returned.
+    
+    The returned objects are shared - callers must not modify them.
     
     Args:
         filepath: Path to the .ppr file
     
     Returns:
-        Dictionary with recording info: duration, sample_count, start_time, end_time, etc.
+        Tuple of (metadata, arrays); metadata includes 'time_multiplier'
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+    """
+    key = _recording_cache_key(filepath)
+    with _recording_cache_lock:
+        entry = _recording_cache.get(key)
+        if entry is not None:
+            _recording_cache.move_to_end(key)
+            return entry
+    
+    # Parse outside the lock so other files can still be served meanwhile
+    entry = _load_recording_arrays(key[0])
+    
+    # The quick summary counts raw lines; now that every line has been
+    # parsed, replace it with the exact sample count and duration
+    metadata, arrays = entry
+    _store_recording_info(key[0], key[1], key[2], build_recording_info(key[0], arrays, metadata))
+    
+    return _store_recording(key, entry)
+
+
+def _store_recording(
+    key: Tuple[str, int, int],
+    entry: Tuple[Dict[str, Any], RecordingArrays]
+) -> Tuple[Dict[str, Any], RecordingArrays]:
+    """
+    Add a parsed recording to the cache and evict least recently used
+    recordings until the total is within RECORDING_CACHE_MAX_SAMPLES.
+    
+    Older versions of the same file are dropped right away. The newest
+    entry is always kept, even if it alone exceeds the limit, so the
+    recording being played isn't parsed again for the next clip.
+    
+    Returns:
+        The cached entry (an existing one if another thread stored it first)
+    """
+    global _recording_cache_samples
+    
+    with _recording_cache_lock:
+        existing = _recording_cache.get(key)
+        if existing is not None:
+            _recording_cache.move_to_end(key)
+            return existing
+        
+        for stale in [k for k in _recording_cache if k[0] == key[0]]:
+            _recording_cache_samples -= len(_recording_cache.pop(stale)[1])
+        
+        _recording_cache[key] = entry
+        _recording_cache_samples += len(entry[1])
+        
+        while _recording_cache_samples > RECORDING_CACHE_MAX_SAMPLES and len(_recording_cache) > 1:
+            _, (_, evicted) = _recording_cache.popitem(last=False)
+            _recording_cache_samples -= len(evicted)
+        
+        return entry
+
+
+def get_trim_range(
+    timestamps: Sequence[int],
+    trim_start: float,
+    trim_end: float,
+    time_multiplier: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Find the sample index range left after trimming a recording.
+
+    Timestamps are monotonically non-decreasing, so the trim boundaries are
+    located with a binary search. Callers can iterate range(lo, hi) over the
+    full recording instead of building a trimmed copy.
+
+    Args:
+        timestamps: Sample timestamps of the whole recording
+        trim_start: Seconds to remove from the beginning
+        trim_end: Seconds to remove from the end
+        time_multiplier: Timestamp units per second (metadata['time_multiplier']).
+                         Detected from the first timestamp if not given.
+
+    Returns:
+        Tuple of (lo, hi): the kept samples are timestamps[lo:hi]
+    """
+    if not timestamps or (trim_start <= 0 and trim_end <= 0):
+        return 0, len(timestamps)
+
+    if time_multiplier is None:
+        time_multiplier = detect_time_multiplier(timestamps[0])
+    start_timestamp = timestamps[0] + trim_start * time_multiplier
+    end_timestamp = timestamps[-1] - trim_end * time_multiplier
+
+    lo = bisect.bisect_left(timestamps, start_timestamp)
+    hi = bisect.bisect_right(timestamps, end_timestamp)
+
+    return lo, max(lo, hi)
+
+
+def build_recording_info(
+    filepath: str,
+    arrays: RecordingArrays,
+    metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the recording summary from an already-loaded recording.
+    
+    Use this instead of get_recording_info when the recording is already in
+    memory, to avoid reading the file a second time.
+    
+    Args:
+        filepath: Path to the .ppr file the data came from
+        arrays: Column view as returned by load_recording_arrays_cached
+        metadata: Header metadata as returned by load_recording_arrays_cached
+    
+    Returns:
+        Dictionary with recording info, or {'error': ...} if there is no data
+    """
+    timestamps = arrays.timestamps
+    if not timestamps:
+        return {'error': 'No data in file'}
+    
+    return _summarize_recording(filepath, timestamps[0], timestamps[-1], len(timestamps), metadata)
+
+
+def _summarize_recording(
+    filepath: str,
+    start_timestamp: int,
+    end_timestamp: int,
+    sample_count: int,
+    metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the recording summary dictionary; only the first and last
+    timestamps and the sample count are needed.
+    """
+    time_multiplier = metadata.get('time_multiplier') or detect_time_multiplier(start_timestamp)
+    duration_sec = (end_timestamp - start_timestamp) / time_multiplier
+    duration_ms = duration_sec * 1000.0
+    
+    return {
+        'filename': Path(filepath).name,
+        'sample_count': sample_count,
+        'duration_sec': duration_sec,
+        'duration_ms': duration_ms,
+        'start_timestamp': start_timestamp,
+        'end_timestamp': end_timestamp,
+        'sample_rate_hz': metadata.get('sample_rate_hz', 'Unknown'),
+        'created': metadata.get('created', 'Unknown'),
+        'version': metadata.get('version', '1.0'),
+    }
+
+
+def _read_recording_info(filepath: str) -> Dict[str, Any]:
+    """
+    Build the recording summary from the header, the first and last data
+    lines and a count of the lines in between.
+    
+    The last line is found by seeking to the end of the file, and the lines
+    in between are counted as raw newlines, so only two samples are parsed.
+    Lines in the middle are not validated: a damaged line inside a recording
+    is still counted as a sample until the file is fully loaded for playback
+    (load_recording_arrays_cached then caches the exact summary).
+    
+    Args:
+        filepath: Path to the .ppr file
+    
+    Returns:
+        Dictionary with recording info, or {'error': ...} on failure
     """
     try:
-        data_list, metadata = read_ppr_file(filepath)
+        metadata = {}
+        first_sample = None
         
-        if not data_list:
-            return {'error': 'No data in file'}
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Recording file not found: {filepath}")
         
-        start_timestamp = data_list[0]['timestamp']
-        end_timestamp = data_list[-1]['timestamp']
-        duration_ms = end_timestamp - start_timestamp
-        duration_sec = duration_ms / 1000.0
+        with f:
+            # Header and first sample
+            for raw in iter(f.readline, b''):
+                line = raw.decode()
+                if line.startswith(';'):
+                    _parse_header_line(line, metadata)
+                    continue
+                
+                first_sample = parse_ppr_line(line)
+                if first_sample is not None:
+                    data_start = f.tell() - len(raw)
+                    break
+            
+            if first_sample is None:
+                raise ValueError(f"No valid data found in file: {filepath}")
+            
+            # Last sample: read backwards from the end of the file
+            last_line, data_end = _read_last_line(f, data_start)
+            last_sample = parse_ppr_line(last_line.decode())
+            if last_sample is None:
+                # Damaged tail - fall back to validating every line
+                return _stream_recording_info(filepath)
+            
+            # Every newline before the last line ends one sample
+            sample_count = _count_newlines(f, data_start, data_end) + 1
         
-        return {
-            'filename': Path(filepath).name,
-            'sample_count': len(data_list),
-            'duration_sec': duration_sec,
-            'duration_ms': duration_ms,
-            'start_timestamp': start_timestamp,
-            'end_timestamp': end_timestamp,
-            'sample_rate_hz': metadata.get('sample_rate_hz', 'Unknown'),
-            'created': metadata.get('created', 'Unknown'),
-            'version': metadata.get('version', '1.0'),
-        }
+        return _summarize_recording(
+            filepath, first_sample['timestamp'], last_sample['timestamp'], sample_count, metadata
+        )
     except Exception as e:
         return {'error': str(e)}
 
 
+def _read_last_line(f, start: int) -> Tuple[bytes, int]:
+    """
+    Return the last non-blank line at or after offset start, and the offset
+    where its content ends. f must be a binary file.
+    """
+    end = f.seek(0, os.SEEK_END)
+    block = 4096
+    while True:
+        pos = max(start, end - block)
+        f.seek(pos)
+        chunk = f.read(end - pos).rstrip()
+        newline = chunk.rfind(b'\n')
+        if newline >= 0 or pos == start:
+            return chunk[newline + 1:], pos + len(chunk)
+        block *= 2
+
+
+def _count_newlines(f, start: int, end: int) -> int:
+    """
+    Count newline bytes in f between offsets start and end, reading in
+    large chunks. f must be a binary file.
+    """
+    f.seek(start)
+    count = 0
+    remaining = end - start
+    while remaining > 0:
+        chunk = f.read(min(READ_BUFFER_SIZE, remaining))
+        if not chunk:
+            break
+        count += chunk.count(b'\n')
+        remaining -= len(chunk)
+    return count
+
+
+def _stream_recording_info(filepath: str) -> Dict[str, Any]:
+    """
+    Build the recording summary by parsing every line (skipping invalid ones).
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the file contains no valid data
+    """
+    metadata = {}
+    first_sample = last_sample = None
+    sample_count = 0
+    for sample in iter_ppr_file(filepath, metadata):
+        if first_sample is None:
+            first_sample = sample
+        last_sample = sample
+        sample_count += 1
+    
+    if not sample_count:
+        raise ValueError(f"No valid data found in file: {filepath}")
+    
+    return _summarize_recording(
+        filepath, first_sample['timestamp'], last_sample['timestamp'], sample_count, metadata
+    )
+
+
+def _get_info_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the in-memory info cache, loading it from disk on first use.
+    Must be called with _info_cache_lock held.
+    """
+    global _info_cache
+    
+    if _info_cache is None:
+        try:
+            with open(Path(RECORDINGS_DIR) / INFO_CACHE_FILENAME, 'r') as f:
+                _info_cache = json.load(f)
+        except (OSError, ValueError):
+            _info_cache = {}
+    
+    return _info_cache
+
+
+def save_info_cache(force: bool = False) -> None:
+    """
+    Write the recording info cache to disk if it has changed.
+    
+    Writes are rate-limited to one per INFO_CACHE_SAVE_INTERVAL so that
+    scanning a directory of new recordings doesn't rewrite the cache per file.
+    
+    Args:
+        force: Write immediately, ignoring the rate limit
+    """
+    global _info_cache_dirty, _info_cache_last_save
+    
+    with _info_cache_lock:
+        if not _info_cache_dirty or _info_cache is None:
+            return
+        
+        now = time.monotonic()
+        if not force and now - _info_cache_last_save < INFO_CACHE_SAVE_INTERVAL:
+            return
+        
+        cache_path = Path(RECORDINGS_DIR) / INFO_CACHE_FILENAME
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            ensure_recordings_directory()
+            with open(tmp_path, 'w') as f:
+                json.dump(_info_cache, f)
+            os.replace(tmp_path, cache_path)
+            _info_cache_dirty = False
+            _info_cache_last_save = now
+        except OSError:
+            # The cache is an optimization only - never fail the caller
+            pass
+
+
+atexit.register(save_info_cache, force=True)
+
+
+def get_recording_info(filepath: str) -> Dict[str, Any]:
+    """
+    Get summary information about a recording file without loading all data.
+    
+    Results are cached by absolute path and validated against the file's
+    modification time and size, so unchanged recordings are only parsed once
+    (the cache survives restarts via a JSON file in the recordings directory).
+    
+    Args:
+        filepath: Path to the .ppr file
+    
+    Returns:
+        Dictionary with recording info: duration, sample_count, start_time, end_time, etc.
+    """
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return {'error': f"Recording file not found: {filepath}"}
+    except OSError as e:
+        return {'error': str(e)}
+    
+    key = os.path.abspath(filepath)
+    
+    with _info_cache_lock:
+        entry = _get_info_cache().get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return dict(entry['info'])
+    
+    info = _read_recording_info(filepath)
+    
+    if 'error' not in info:
+        _store_recording_info(key, stat.st_mtime_ns, stat.st_size, info)
+        info = dict(info)
+    
+    return info
+
+
+def _store_recording_info(key: str, mtime_ns: int, size: int, info: Dict[str, Any]) -> None:
+    """
+    Cache a recording summary under its absolute path, validated by the
+    file's modification time and size.
+    """
+    global _info_cache_dirty
+    
+    with _info_cache_lock:
+        _get_info_cache()[key] = {
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'info': info,
+        }
+        _info_cache_dirty = True
+    save_info_cache()
+
+
+def forget_recording_info(filepath: str) -> None:
+    """
+    Drop a recording's cached summary (e.g. after the file is deleted).
+    
+    Args:
+        filepath: Path to the .ppr file
+    """
+    global _info_cache_dirty
+    
+    with _info_cache_lock:
+        if _get_info_cache().pop(os.path.abspath(filepath), None) is not None:
+            _info_cache_dirty = True
+    save_info_cache()
+
+
+def prune_info_cache(filepaths: List[str]) -> None:
+    """
+    Drop cached summaries for every recording not in filepaths.
+    
+    Call with the current directory listing so entries for files that were
+    deleted or renamed outside the application don't accumulate.
+    
+    Args:
+        filepaths: Paths of the recordings that still exist
+    """
+    global _info_cache_dirty
+    
+    keep = {os.path.abspath(path) for path in filepaths}
+    with _info_cache_lock:
+        cache = _get_info_cache()
+        stale = [key for key in cache if key not in keep]
+        for key in stale:
+            del cache[key]
+        if stale:
+            _info_cache_dirty = True
+    save_info_cache()
+
+
+def get_recordings_info(filepaths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get summary information for several recording files concurrently.
+    
+    Each lookup is a stat plus, on a cache miss, a file read, so running them
+    on a small thread pool overlaps the per-file I/O latency.
+    
+    Args:
+        filepaths: Paths to .ppr files
+    
+    Returns:
+        List of info dictionaries in the same order as filepaths
+        (see get_recording_info; failures are {'error': ...} entries)
+    """
+    if len(filepaths) <= 1:
+        return [get_recording_info(path) for path in filepaths]
+    
+    with ThreadPoolExecutor(max_workers=min(INFO_MAX_WORKERS, len(filepaths))) as executor:
+        return list(executor.map(get_recording_info, filepaths))
+
+
 def list_recordings() -> List[str]:
     """
     List all available PPR recording files in the recordings directory.
@@ -321,12 +953,15 @@ def list_recordings() -> List[str]:
         List of filenames (without path)
     """
     ensure_recordings_directory()
-    recordings_path = Path(RECORDINGS_DIR)
     
-    # Get all .ppr files
-    ppr_files = sorted(recordings_path.glob(f"*{FILE_EXTENSION}"), reverse=True)
+    # Get all .ppr files (scandir exposes the entry type without a stat per file)
+    with os.scandir(RECORDINGS_DIR) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.endswith(FILE_EXTENSION) and entry.is_file()
+        ]
     
-    return [f.name for f in ppr_files]
+    return sorted(names, reverse=True)
 
 
 # Example usage and testing
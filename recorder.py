@@ -5,29 +5,29 @@ Records robot movements in real-time and saves to PPR format files.
 """
 
 import time
+import queue
 import threading
 import logging
-from typing import Optional, Dict, List, Any
+from typing import TYPE_CHECKING, Optional, Dict, List, Any
 from pathlib import Path
 
-try:
+if TYPE_CHECKING:
+    # Only needed for annotations; the interface object is passed in
     from piper_sdk import C_PiperInterface_V2
-except ImportError:
-    # For testing without SDK
-    C_PiperInterface_V2 = None
 
 from ppr_file_handler import (
     create_ppr_filename,
     get_full_filepath,
     write_ppr_header,
-    write_ppr_line,
+    format_ppr_line,
     ensure_recordings_directory
 )
 
 
 # Constants
 DEFAULT_SAMPLE_RATE = 200  # Hz
-WRITE_BUFFER_SIZE = 20  # Write to disk every N samples
+WRITE_BUFFER_SIZE = 200  # Write to disk every N samples (1 s at 200 Hz)
+FILE_BUFFER_SIZE = 64 * 1024  # Bytes buffered by the open file object
 
 
 class PiperRecorder:
@@ -36,7 +36,7 @@ class PiperRecorder:
     
     Features:
     - Real-time recording at up to 200 Hz
-    - Buffered writing for performance
+    - Buffered writing on a background thread
     - Thread-safe operation
     - Automatic file management
     """
@@ -61,7 +61,12 @@ class PiperRecorder:
         # File handling
         self._current_file = None
         self._current_filepath: Optional[Path] = None
+        self._current_filename = ""  # Cached _current_filepath.name for stats
         self._write_buffer: List[tuple] = []
+        # Full buffers are formatted and written by a separate writer thread,
+        # so disk stalls don't delay sampling
+        self._write_queue: "queue.Queue[Optional[List[tuple]]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
         
         # Statistics
         self._sample_count = 0
@@ -150,12 +155,13 @@ class PiperRecorder:
         
         # Get full filepath
         self._current_filepath = get_full_filepath(filename)
+        self._current_filename = self._current_filepath.name
         
         self.logger.info(f"Starting recording: {self._current_filepath}")
         
         # Open file and write header
         try:
-            self._current_file = open(self._current_filepath, 'w')
+            self._current_file = open(self._current_filepath, 'w', buffering=FILE_BUFFER_SIZE)
             metadata = {
                 "sample_rate_hz": self.sample_rate,
                 "description": description
@@ -174,7 +180,9 @@ class PiperRecorder:
         self._is_recording = True
         self._write_buffer = []
         
-        # Start recording thread
+        # Start writer and recording threads
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
         self._recording_thread = threading.Thread(target=self._record_loop, daemon=True)
         self._recording_thread.start()
         
@@ -206,8 +214,12 @@ class PiperRecorder:
         if self._recording_thread and self._recording_thread.is_alive():
             self._recording_thread.join(timeout=2.0)
         
-        # Flush any remaining buffered data
+        # Hand over any remaining buffered data and let the writer drain
         self._flush_buffer()
+        self._write_queue.put(None)
+        if self._writer_thread and self._writer_thread.is_alive():
+            self._writer_thread.join()
+        self._writer_thread = None
         
         # Close file
         if self._current_file:
@@ -219,7 +231,7 @@ class PiperRecorder:
         avg_rate = self._sample_count / duration if duration > 0 else 0
         
         stats = {
-            'filename': self._current_filepath.name if self._current_filepath else "",
+            'filename': self._current_filename,
             'filepath': str(self._current_filepath) if self._current_filepath else "",
             'sample_count': self._sample_count,
             'duration_sec': duration,
@@ -330,23 +342,38 @@ class PiperRecorder:
     
     def _flush_buffer(self):
         """
-        Write all buffered samples to disk.
+        Queue all buffered samples for the writer thread.
         """
-        if not self._write_buffer or not self._current_file:
+        if not self._write_buffer:
             return
         
-        try:
-            for timestamp, cartesian, joints, gripper in self._write_buffer:
-                write_ppr_line(self._current_file, timestamp, cartesian, joints, gripper)
-            
-            # Flush to disk
-            self._current_file.flush()
-            
-            # Clear buffer
-            self._write_buffer = []
+        self._write_queue.put(self._write_buffer)
+        self._write_buffer = []
+    
+    def _writer_loop(self):
+        """
+        Writer loop - runs in separate thread.
+        Writes queued sample batches to disk until it receives None.
+        """
+        while True:
+            batch = self._write_queue.get()
+            if batch is None:
+                break
+            if not self._current_file:
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Failed to write buffer to disk: {e}")
+            try:
+                # Format the whole batch and hand it to the file in one write
+                self._current_file.write(''.join(
+                    format_ppr_line(timestamp, cartesian, joints, gripper)
+                    for timestamp, cartesian, joints, gripper in batch
+                ))
+                
+                # Flush to disk
+                self._current_file.flush()
+                
+            except Exception as e:
+                self.logger.error(f"Failed to write buffer to disk: {e}")
     
     def is_recording(self) -> bool:
         """
@@ -376,7 +403,7 @@ class PiperRecorder:
             'duration_sec': duration,
             'current_rate': current_rate,
             'target_rate': self.sample_rate,
-            'filename': self._current_filepath.name if self._current_filepath else ""
+            'filename': self._current_filename
         }
 
 
@@ -4,6 +4,7 @@ Single entry point: CAN bus activation, Piper SDK init, HTTP + WebSocket server.
 """
 
 import asyncio
+import functools
 import json
 import sys
 import os
@@ -11,6 +12,7 @@ import subprocess
 import time
 import threading
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -28,11 +30,19 @@ try:
 except ImportError:
     SDK_AVAILABLE = False
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Import project modules
 from recorder import PiperRecorder
 from player import PiperPlayer
-from ppr_file_handler import list_recordings, get_recording_info, read_ppr_file
-from timeline import Timeline, TimelineClip, TimelineManager
+from ppr_file_handler import (
+    RECORDINGS_DIR, list_recordings, get_recordings_info, forget_recording_info, prune_info_cache
+)
+from timeline import TimelineManager
 from timeline_player import TimelinePlayer
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
@@ -42,10 +52,23 @@ HOST = "0.0.0.0"
 HTTP_PORT = 8000
 WS_PORT = 8080
 WEB_DIR = Path(__file__).parent / "web"
+RECORDINGS_PATH = Path(RECORDINGS_DIR)  # Relative to the working directory, like ppr_file_handler
+SERVER_RECORDINGS_PATH = Path(__file__).parent / RECORDINGS_DIR  # Next to this file (node playback)
 CAN_ACTIVATE_SCRIPT = Path(__file__).parent / "piper_sdk" / "piper_sdk" / "can_activate.sh"
 STATUS_UPDATE_HZ = 5
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the default executor so the event loop stays responsive.
+    (Equivalent to asyncio.to_thread, which needs Python 3.9+.)"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 # ---------------------------------------------------------------------------
 # CAN Bus Activation
 # ---------------------------------------------------------------------------
@@ -143,23 +166,29 @@ class PiperServer:
         self.is_recording = False
         self.is_playing = False
         self._node_playback_active = False  # Track node-based playback separately
+        self._recording_starting = False  # Recorder is being set up off the event loop
+        self._published_state: Optional[tuple] = None  # (connected, recording, playing) last broadcast
+        self._reset_task: Optional[asyncio.Task] = None
+        self._connect_task: Optional[asyncio.Task] = None
+        self._warm_task: Optional[asyncio.Task] = None
         self._status_task: Optional[asyncio.Task] = None
+        self._status_wakeup: Optional[asyncio.Event] = None  # Created in run(), on the server's loop
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     # -- WebSocket broadcast ------------------------------------------------
 
     async def broadcast(self, data: dict):
-        """Send JSON message to all connected web clients."""
+        """
+        Send JSON message to all connected web clients.
+        
+        websockets.broadcast queues the frame on every open connection without
+        waiting on any of them, so one slow client can't stall the status loop
+        or the other clients. Closed connections are skipped; ws_handler
+        removes them from ws_clients when they disconnect.
+        """
         if not self.ws_clients:
             return
-        msg = json.dumps(data)
-        stale = set()
-        for ws in self.ws_clients:
-            try:
-                await ws.send(msg)
-            except Exception:
-                stale.add(ws)
-        self.ws_clients -= stale
+        websockets.broadcast(self.ws_clients, json.dumps(data))
 
     async def send(self, ws, data: dict):
         """Send JSON message to a single client."""
@@ -197,49 +226,79 @@ class PiperServer:
             "joints": self._get_joint_positions(),
         }
 
+    async def _publish_state(self):
+        """
+        Broadcast status to all clients if the connected/recording/playing
+        state has changed since the last broadcast.
+        
+        Call after any state transition; repeated calls without a change
+        send nothing.
+        """
+        state = (self.piper is not None, self.is_recording, self.is_playing)
+        if state != self._published_state:
+            self._published_state = state
+            await self.broadcast(self._build_status())
+
     # -- Periodic status broadcast ------------------------------------------
 
     async def _status_loop(self):
-        """Broadcast status at STATUS_UPDATE_HZ while recording or playing."""
+        """
+        Broadcast status at STATUS_UPDATE_HZ while recording or playing a
+        timeline.
+        
+        Otherwise there is nothing to poll (the players push their own
+        progress), so the loop sleeps until a handler starts recording and
+        calls _wake_status_loop().
+        """
+        last_progress = None  # Last progress message sent, to skip repeats
         while True:
             try:
+                progress = None
                 if self.is_recording and self.recorder:
                     stats = self.recorder.get_recording_stats()
-                    await self.broadcast({
+                    progress = {
                         "type": "recording_progress",
                         "samples": stats.get("sample_count", 0),
                         "duration": round(stats.get("duration_sec", 0), 2),
                         "rate": round(stats.get("current_rate", 0), 1),
-                    })
+                    }
                 elif self.is_playing:
-                    if self._node_playback_active:
-                        # Node-based playback manages its own state - don't interfere
+                    if self._node_playback_active or (self.player and self.player.is_playing()):
+                        # Node-based playback and the single-recording player
+                        # push their own progress - don't interfere
                         pass
-                    elif self.player and self.player.is_playing():
-                        info = self.player.get_playback_info()
-                        await self.broadcast({
-                            "type": "playback_progress",
-                            "progress": round(info.get("progress_percent", 0), 1),
-                            "current_sample": info.get("current_sample", 0),
-                            "total_samples": info.get("total_samples", 0),
-                            "status": "playing",
-                        })
                     elif self.timeline_player and self.timeline_player.is_playing:
                         tp = self.timeline_player.get_progress()
-                        await self.broadcast({
+                        progress = {
                             "type": "playback_progress",
-                            "progress": round(tp.get("progress_percent", 0), 1),
+                            "progress": int(tp.get("progress_percent", 0)),
                             "current_position": round(tp.get("current_position", 0), 2),
                             "total_duration": round(tp.get("total_duration", 0), 2),
                             "status": "playing",
-                        })
+                        }
                     else:
                         # Playback finished (only for legacy player/timeline_player modes)
                         self.is_playing = False
                         await self.broadcast({"type": "timeline_complete"})
+                        await self._publish_state()
+
+                # Unchanged progress (e.g. while paused) isn't sent again
+                if progress != last_progress:
+                    if progress is not None:
+                        await self.broadcast(progress)
+                    last_progress = progress
             except Exception as e:
                 logger.debug(f"Status loop error: {e}")
-            await asyncio.sleep(1.0 / STATUS_UPDATE_HZ)
+            if self.is_recording or (self.is_playing and self.timeline_player is not None):
+                await asyncio.sleep(1.0 / STATUS_UPDATE_HZ)
+            else:
+                await self._status_wakeup.wait()
+                self._status_wakeup.clear()
+
+    def _wake_status_loop(self):
+        """Resume the status loop after recording or playback starts (event loop only)."""
+        if self._status_wakeup is not None:
+            self._status_wakeup.set()
 
     # -- Command handlers ---------------------------------------------------
 
@@ -277,59 +336,89 @@ class PiperServer:
         await self.send(ws, self._build_status())
 
     async def _handle_get_recordings(self, ws, msg):
+        # Directory scan and file parsing run off the event loop
+        recordings = await run_blocking(self._scan_recordings)
+        await self.send(ws, {"type": "recordings_list", "recordings": recordings})
+
+    def _scan_recordings(self) -> list:
+        """Build the recordings list sent to clients (blocking: stats/reads files)."""
         recordings = []
-        for name in list_recordings():
-            info = get_recording_info(str(Path("recordings") / name))
+        names = list_recordings()
+        filepaths = [str(RECORDINGS_PATH / name) for name in names]
+        infos = get_recordings_info(filepaths)
+        prune_info_cache(filepaths)
+        for name, info in zip(names, infos):
             recordings.append({
                 "name": name,
                 "duration": round(info.get("duration_sec", 0), 2),
                 "samples": info.get("sample_count", 0),
                 "created": info.get("created", ""),
             })
-        await self.send(ws, {"type": "recordings_list", "recordings": recordings})
+        return recordings
 
     async def _handle_start_recording(self, ws, msg):
         if not self.piper:
             await self.send(ws, {"type": "error", "message": "Robot not connected"})
             return
-        if self.is_recording:
+        if self.is_recording or self._recording_starting:
             await self.send(ws, {"type": "error", "message": "Already recording"})
             return
 
         name = msg.get("name")
-        self.recorder = PiperRecorder(self.piper, sample_rate=200)
-        filepath = self.recorder.start_recording(filename=name, description="Web recording")
+        recorder = PiperRecorder(self.piper, sample_rate=200)
+        # Enabling the robot and gripper takes several hundred ms of sleeps
+        self._recording_starting = True
+        try:
+            filepath = await run_blocking(
+                recorder.start_recording, filename=name, description="Web recording"
+            )
+        finally:
+            self._recording_starting = False
+        self.recorder = recorder
         self.is_recording = True
+        self._wake_status_loop()
         await self.broadcast({"type": "log", "level": "info", "message": f"Recording started: {Path(filepath).name}"})
-        await self.broadcast(self._build_status())
+        await self._publish_state()
 
     async def _handle_stop_recording(self, ws, msg):
         if not self.is_recording or not self.recorder:
             await self.send(ws, {"type": "error", "message": "Not recording"})
             return
 
-        stats = self.recorder.stop_recording()
-        self.is_recording = False
+        # Detach the recorder first so a second stop request is rejected while
+        # this one joins the recording thread and flushes the file off the loop
+        recorder = self.recorder
         self.recorder = None
+        self.is_recording = False
+        stats = await run_blocking(recorder.stop_recording)
         await self.broadcast({
             "type": "log", "level": "info",
             "message": f"Recording saved: {stats.get('filename', '?')} ({stats.get('sample_count', 0)} samples, {stats.get('duration_sec', 0):.1f}s)"
         })
-        await self.broadcast(self._build_status())
+        await self._publish_state()
+
+    def _get_player(self) -> PiperPlayer:
+        """Return the single-recording player, creating it on first use."""
+        if self.player is None or self.player.piper is not self.piper:
+            self.player = PiperPlayer(self.piper)
+        return self.player
 
     async def _handle_load_recording(self, ws, msg):
         """Load a recording and prepare for single-file playback."""
         name = msg.get("name", "")
-        filepath = Path("recordings") / name
-        if not filepath.exists():
-            await self.send(ws, {"type": "error", "message": f"Recording not found: {name}"})
-            return
+        filepath = RECORDINGS_PATH / name
         if not self.piper:
             await self.send(ws, {"type": "error", "message": "Robot not connected"})
             return
 
-        self.player = PiperPlayer(self.piper)
-        info = self.player.load_recording(str(filepath))
+        # Parsing a long recording takes a while - keep it off the event loop.
+        # A failed load leaves the previously loaded recording in place.
+        player = self._get_player()
+        try:
+            info = await run_blocking(player.load_recording, str(filepath))
+        except FileNotFoundError:
+            await self.send(ws, {"type": "error", "message": f"Recording not found: {name}"})
+            return
         await self.send(ws, {
             "type": "recording_loaded",
             "name": name,
@@ -351,21 +440,50 @@ class PiperServer:
         # If a recording name is provided, load it first
         name = msg.get("name")
         if name:
-            filepath = Path("recordings") / name
-            if not filepath.exists():
+            filepath = RECORDINGS_PATH / name
+            try:
+                await run_blocking(self._get_player().load_recording, str(filepath))
+            except FileNotFoundError:
                 await self.send(ws, {"type": "error", "message": f"Recording not found: {name}"})
                 return
-            self.player = PiperPlayer(self.piper)
-            self.player.load_recording(str(filepath))
 
         if not self.player or not self.player.is_loaded():
             await self.send(ws, {"type": "error", "message": "No recording loaded"})
             return
 
+        # The player pushes progress and completion from its thread
+        self.player.on_progress = self._on_player_progress
+        self.player.on_complete = functools.partial(self._on_player_complete, self.player)
         self.player.start_playback(speed_multiplier=speed)
         self.is_playing = True
         await self.broadcast({"type": "log", "level": "info", "message": f"Playback started at {speed}x"})
-        await self.broadcast(self._build_status())
+        await self._publish_state()
+
+    def _on_player_progress(self, progress: float, current_sample: int, total_samples: int):
+        """PiperPlayer on_progress callback (playback thread)."""
+        asyncio.run_coroutine_threadsafe(
+            self.broadcast({
+                "type": "playback_progress",
+                "progress": int(progress),  # Whole percent, matching PROGRESS_STEPS
+                "current_sample": current_sample,
+                "total_samples": total_samples,
+                "status": "playing",
+            }),
+            self._loop
+        )
+
+    def _on_player_complete(self, player: PiperPlayer):
+        """PiperPlayer on_complete callback (playback thread)."""
+        asyncio.run_coroutine_threadsafe(self._finish_single_playback(player), self._loop)
+
+    async def _finish_single_playback(self, player: PiperPlayer):
+        # Only report natural ends: is_playing is already cleared if the user
+        # pressed stop, and a newer playback may have started since
+        if (self.is_playing and not self._node_playback_active
+                and player is self.player and not player.is_playing()):
+            self.is_playing = False
+            await self.broadcast({"type": "timeline_complete"})
+            await self._publish_state()
 
     async def _handle_stop_playback(self, ws, msg):
         if self.player and self.player.is_playing():
@@ -375,7 +493,7 @@ class PiperServer:
         self.is_playing = False
         self._node_playback_active = False  # Also stop node-based playback
         await self.broadcast({"type": "log", "level": "info", "message": "Playback stopped"})
-        await self.broadcast(self._build_status())
+        await self._publish_state()
 
     async def _handle_pause_playback(self, ws, msg):
         if self.player and self.player.is_playing():
@@ -426,10 +544,8 @@ class PiperServer:
         loop = asyncio.get_event_loop()
 
         def on_complete():
-            asyncio.run_coroutine_threadsafe(
-                self.broadcast({"type": "timeline_complete"}), loop
-            )
             self.is_playing = False
+            asyncio.run_coroutine_threadsafe(self._finish_node_playback(), loop)
 
         def on_node_start(node_id):
             asyncio.run_coroutine_threadsafe(
@@ -448,7 +564,11 @@ class PiperServer:
         thread.start()
 
         await self.broadcast({"type": "log", "level": "info", "message": f"Playback started at {speed}x ({len(execution_order)} recordings)"})
-        await self.broadcast(self._build_status())
+        await self._publish_state()
+
+    async def _finish_node_playback(self):
+        await self.broadcast({"type": "timeline_complete"})
+        await self._publish_state()
 
     def _get_node_execution_order(self, nodes: list, connections: list) -> list:
         """
@@ -484,27 +604,27 @@ class PiperServer:
 
         # If no explicit start nodes, sort by x position (leftmost first)
         if not start_nodes:
-            start_nodes = [sorted(nodes, key=lambda n: n.get("x", 0))[0]["id"]]
+            start_nodes = [min(nodes, key=lambda n: n.get("x", 0))["id"]]
 
-        # Topological sort using BFS
+        # Topological sort using BFS; a node is queued once all of its
+        # predecessors have been visited (tracked as a countdown, not a rescan)
         result = []
         visited = set()
-        queue = list(start_nodes)
+        queue = deque(start_nodes)
+        pending_preds = {node_id: len(preds) for node_id, preds in incoming.items()}
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             if node_id in visited:
                 continue
             visited.add(node_id)
             result.append(node_map[node_id])
 
             # Add connected nodes to queue
-            for next_id in outgoing.get(node_id, []):
-                if next_id not in visited:
-                    # Only add if all predecessors have been visited
-                    all_preds_visited = all(pred in visited for pred in incoming[next_id])
-                    if all_preds_visited:
-                        queue.append(next_id)
+            for next_id in outgoing[node_id]:
+                pending_preds[next_id] -= 1
+                if next_id not in visited and pending_preds[next_id] == 0:
+                    queue.append(next_id)
 
         # Add any remaining unvisited nodes (disconnected nodes)
         for node in nodes:
@@ -531,6 +651,9 @@ class PiperServer:
             # Initialize robot once before playing all nodes
             logger.info("Preparing robot for playback...")
             self._prepare_robot_for_playback()
+
+            # One player for the whole sequence; each node just loads into it
+            player = PiperPlayer(self.piper)
             
             logger.info(f"Entering node loop. is_playing={self.is_playing}, _node_playback_active={self._node_playback_active}")
             
@@ -557,21 +680,17 @@ class PiperServer:
                 logger.info(f"Playing node {node_id}: {recording_name} at {effective_speed}x")
 
                 # Build recording path (relative to server location)
-                server_dir = Path(__file__).parent
-                filepath = server_dir / "recordings" / recording_name
-                
-                if not filepath.exists():
-                    logger.error(f"Recording not found: {filepath}")
-                    logger.error(f"  Server dir: {server_dir}")
-                    logger.error(f"  Recording name: {recording_name}")
-                    continue
+                filepath = SERVER_RECORDINGS_PATH / recording_name
 
-                # Play using PiperPlayer
-                player = PiperPlayer(self.piper)
-                
+                # Just try to load; a missing file surfaces as FileNotFoundError
                 try:
                     info = player.load_recording(str(filepath))
                     logger.info(f"Loaded recording: {info.get('sample_count', 0)} samples, {info.get('duration_sec', 0):.1f}s")
+                except FileNotFoundError:
+                    logger.error(f"Recording not found: {filepath}")
+                    logger.error(f"  Recordings dir: {SERVER_RECORDINGS_PATH}")
+                    logger.error(f"  Recording name: {recording_name}")
+                    continue
                 except Exception as load_err:
                     logger.error(f"Failed to load recording {recording_name}: {load_err}")
                     continue
@@ -582,19 +701,19 @@ class PiperServer:
                 
                 logger.info(f"Playback started for {recording_name}, waiting for completion...")
 
-                # Wait for playback to complete
+                # Wait for playback to complete, checking for stop every 50ms
+                # (returns as soon as the node ends rather than on the next tick)
                 wait_count = 0
-                while player.is_playing():
+                while not player.wait_for_completion(0.05):
                     if not self.is_playing:
                         player.stop_playback()
                         logger.info("Playback stopped by user")
                         break
-                    time.sleep(0.05)
                     wait_count += 1
                     # Log progress every ~2 seconds
                     if wait_count % 40 == 0:
-                        progress = player.get_playback_info()
-                        logger.info(f"  Playing: {progress.get('current_sample', 0)}/{progress.get('total_samples', 0)} samples")
+                        current, total = player.get_sample_position()
+                        logger.info(f"  Playing: {current}/{total} samples")
                 
                 logger.info(f"Finished playing {recording_name}")
 
@@ -670,33 +789,44 @@ class PiperServer:
             await self.send(ws, {"type": "error", "message": "Name and data required"})
             return
 
+        # Serializing and writing a large canvas runs off the event loop
+        await run_blocking(self._write_timeline, name, data)
+        await self.send(ws, {"type": "log", "level": "info", "message": f"Timeline saved: {name}"})
+
+    def _write_timeline(self, name: str, data: dict):
+        """Save timeline data as JSON (blocking: writes a file)."""
         tl_path = self.timeline_manager.get_timeline_path(name)
         tl_path.parent.mkdir(exist_ok=True)
         with open(tl_path, "w") as f:
             json.dump(data, f, indent=2)
-        await self.send(ws, {"type": "log", "level": "info", "message": f"Timeline saved: {name}"})
 
     async def _handle_load_timeline(self, ws, msg):
         name = msg.get("name", "")
-        tl_path = self.timeline_manager.get_timeline_path(name)
-        if not tl_path.exists():
+        try:
+            data = await run_blocking(self._read_timeline, name)
+        except FileNotFoundError:
             await self.send(ws, {"type": "error", "message": f"Timeline not found: {name}"})
             return
-        with open(tl_path, "r") as f:
-            data = json.load(f)
         await self.send(ws, {"type": "timeline_loaded", "name": name, "data": data})
 
+    def _read_timeline(self, name: str) -> dict:
+        """Load timeline JSON data (blocking: reads a file)."""
+        with open(self.timeline_manager.get_timeline_path(name), "r") as f:
+            return json.load(f)
+
     async def _handle_list_timelines(self, ws, msg):
-        names = self.timeline_manager.list_timelines()
+        names = await run_blocking(self.timeline_manager.list_timelines)
         await self.send(ws, {"type": "timelines_list", "timelines": names})
 
     async def _handle_delete_recording(self, ws, msg):
         name = msg.get("name", "")
-        filepath = Path("recordings") / name
-        if not filepath.exists():
+        filepath = RECORDINGS_PATH / name
+        try:
+            filepath.unlink()
+        except FileNotFoundError:
             await self.send(ws, {"type": "error", "message": f"Recording not found: {name}"})
             return
-        filepath.unlink()
+        forget_recording_info(str(filepath))
         await self.broadcast({"type": "log", "level": "info", "message": f"Deleted recording: {name}"})
 
     async def _handle_reset_robot(self, ws, msg):
@@ -706,97 +836,60 @@ class PiperServer:
         """
         await self.broadcast({"type": "log", "level": "warning", "message": "Robot reset initiated..."})
 
-        loop = asyncio.get_event_loop()
-
-        def do_reset():
-            try:
-                # Step 1: Send reset command (mirrors piper_ctrl_reset.py)
-                if self.piper:
-                    logger.info("Sending reset command to robot arm...")
-                    asyncio.run_coroutine_threadsafe(
-                        self.broadcast({"type": "log", "level": "info", "message": "Step 1/3: Sending reset command..."}),
-                        loop
-                    )
-                    self.piper.MotionCtrl_1(0x02, 0, 0)  # Resume/reset
-                    self.piper.MotionCtrl_2(0, 0, 0, 0x00)  # Position-velocity mode
-                    time.sleep(0.5)
-                else:
-                    logger.warning("Robot not connected — skipping SDK reset command")
-                    asyncio.run_coroutine_threadsafe(
-                        self.broadcast({"type": "log", "level": "warning", "message": "Step 1/3: Robot not connected — skipping SDK reset"}),
-                        loop
-                    )
+        # The reset takes seconds; run it as a task so this client's other
+        # messages are still handled meanwhile
+        self._reset_task = asyncio.ensure_future(self._reset_robot())
 
-                # Step 2: Re-activate CAN bus (mirrors can_activate.sh)
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "log", "level": "info", "message": "Step 2/3: Re-activating CAN bus..."}),
-                    loop
-                )
-                can_ok = activate_can_bus()
-                if can_ok:
-                    asyncio.run_coroutine_threadsafe(
-                        self.broadcast({"type": "log", "level": "success", "message": "CAN bus re-activated successfully"}),
-                        loop
-                    )
-                else:
-                    asyncio.run_coroutine_threadsafe(
-                        self.broadcast({"type": "log", "level": "warning", "message": "CAN bus activation skipped (demo mode or failed)"}),
-                        loop
-                    )
-
-                # Step 3: Re-enable robot arm (mirrors piper_ctrl_enable.py)
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "log", "level": "info", "message": "Step 3/3: Re-enabling robot arm..."}),
-                    loop
-                )
-                if self.piper:
-                    enabled = False
-                    for attempt in range(200):
-                        if self.piper.EnablePiper():
-                            enabled = True
-                            logger.info(f"Robot re-enabled after reset (attempt {attempt + 1})")
-                            break
-                        time.sleep(0.01)
-
-                    if enabled:
-                        asyncio.run_coroutine_threadsafe(
-                            self.broadcast({"type": "log", "level": "success", "message": "Robot arm re-enabled successfully"}),
-                            loop
-                        )
-                    else:
-                        asyncio.run_coroutine_threadsafe(
-                            self.broadcast({"type": "log", "level": "warning", "message": "EnablePiper() did not confirm — continuing anyway"}),
-                            loop
-                        )
+    async def _reset_robot(self):
+        """Run the reset sequence, with each blocking step off the event loop."""
+        try:
+            # Step 1: Send reset command (mirrors piper_ctrl_reset.py)
+            if self.piper:
+                logger.info("Sending reset command to robot arm...")
+                await self.broadcast({"type": "log", "level": "info", "message": "Step 1/3: Sending reset command..."})
+                await run_blocking(self.piper.MotionCtrl_1, 0x02, 0, 0)  # Resume/reset
+                await run_blocking(self.piper.MotionCtrl_2, 0, 0, 0, 0x00)  # Position-velocity mode
+                await asyncio.sleep(0.5)
+            else:
+                logger.warning("Robot not connected — skipping SDK reset command")
+                await self.broadcast({"type": "log", "level": "warning", "message": "Step 1/3: Robot not connected — skipping SDK reset"})
+
+            # Step 2: Re-activate CAN bus (mirrors can_activate.sh)
+            await self.broadcast({"type": "log", "level": "info", "message": "Step 2/3: Re-activating CAN bus..."})
+            can_ok = await run_blocking(activate_can_bus)
+            if can_ok:
+                await self.broadcast({"type": "log", "level": "success", "message": "CAN bus re-activated successfully"})
+            else:
+                await self.broadcast({"type": "log", "level": "warning", "message": "CAN bus activation skipped (demo mode or failed)"})
+
+            # Step 3: Re-enable robot arm (mirrors piper_ctrl_enable.py)
+            await self.broadcast({"type": "log", "level": "info", "message": "Step 3/3: Re-enabling robot arm..."})
+            if self.piper:
+                enabled = await run_blocking(self._reenable_robot)
+                if enabled:
+                    await self.broadcast({"type": "log", "level": "success", "message": "Robot arm re-enabled successfully"})
                 else:
-                    asyncio.run_coroutine_threadsafe(
-                        self.broadcast({"type": "log", "level": "warning", "message": "Step 3/3: Robot not connected — skipping enable"}),
-                        loop
-                    )
+                    await self.broadcast({"type": "log", "level": "warning", "message": "EnablePiper() did not confirm — continuing anyway"})
+            else:
+                await self.broadcast({"type": "log", "level": "warning", "message": "Step 3/3: Robot not connected — skipping enable"})
 
-                # Broadcast updated status
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "reset_complete", "success": True}),
-                    loop
-                )
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "log", "level": "success", "message": "Robot reset complete"}),
-                    loop
-                )
+            # Broadcast updated status
+            await self.broadcast({"type": "reset_complete", "success": True})
+            await self.broadcast({"type": "log", "level": "success", "message": "Robot reset complete"})
 
-            except Exception as e:
-                logger.error(f"Robot reset failed: {e}")
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "reset_complete", "success": False, "message": str(e)}),
-                    loop
-                )
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast({"type": "log", "level": "error", "message": f"Robot reset failed: {e}"}),
-                    loop
-                )
+        except Exception as e:
+            logger.error(f"Robot reset failed: {e}")
+            await self.broadcast({"type": "reset_complete", "success": False, "message": str(e)})
+            await self.broadcast({"type": "log", "level": "error", "message": f"Robot reset failed: {e}"})
 
-        thread = threading.Thread(target=do_reset, daemon=True)
-        thread.start()
+    def _reenable_robot(self, max_attempts: int = 200) -> bool:
+        """Retry EnablePiper() until it confirms (blocking). Returns True if enabled."""
+        for attempt in range(max_attempts):
+            if self.piper.EnablePiper():
+                logger.info(f"Robot re-enabled after reset (attempt {attempt + 1})")
+                return True
+            time.sleep(0.01)
+        return False
 
     # -- WebSocket handler --------------------------------------------------
 
@@ -861,7 +954,8 @@ class PiperServer:
         # Strip query string cache busters (e.g. ?v=2) — path only
         filename = request.match_info["filename"].split("?")[0]
         filepath = WEB_DIR / filename
-        if filepath.exists() and filepath.is_file():
+        # is_file() is False for missing paths too - one stat per request
+        if filepath.is_file():
             resp = web.FileResponse(filepath)
             resp.headers.update(self._NO_CACHE_HEADERS)
             return resp
@@ -884,10 +978,47 @@ class PiperServer:
             logger.info(f"WebSocket server listening on ws://{HOST}:{WS_PORT}")
             await asyncio.Future()  # run forever
 
+    async def connect_robot_in_background(self):
+        """
+        Activate the CAN bus, then connect and enable the robot, without
+        holding up the servers.
+        
+        Until this finishes self.piper stays None, so commands that need the
+        robot are rejected and clients see connected=False.
+        """
+        can_ok = await run_blocking(activate_can_bus)
+        if can_ok:
+            print("  CAN bus: OK")
+        else:
+            print("  CAN bus: SKIPPED (demo mode)")
+
+        piper = await run_blocking(connect_robot)
+        if piper:
+            print("  Robot: CONNECTED + ENABLED")
+        else:
+            print("  Robot: NOT CONNECTED (demo mode)")
+        self.piper = piper
+        await self._publish_state()
+
+    async def _warm_recordings_info(self):
+        """
+        Summarize every recording once at startup, so the first client's
+        recordings list is served from the info cache instead of the disk.
+        """
+        try:
+            recordings = await run_blocking(self._scan_recordings)
+            logger.info(f"Recording info cache warmed ({len(recordings)} recordings)")
+        except Exception as e:
+            logger.warning(f"Could not pre-load recording info: {e}")
+
     async def run(self):
         """Start HTTP server, WebSocket server, and status loop."""
         self._loop = asyncio.get_event_loop()
+        self._status_wakeup = asyncio.Event()
         self._status_task = asyncio.create_task(self._status_loop())
+        if self.piper is None:
+            self._connect_task = asyncio.create_task(self.connect_robot_in_background())
+        self._warm_task = asyncio.create_task(self._warm_recordings_info())
         await asyncio.gather(
             self.start_http_server(),
             self.start_ws_server(),
@@ -903,21 +1034,10 @@ def main():
     print("  Piper Automation System - Web Server")
     print("=" * 60)
 
-    # Step 1: CAN bus activation
-    print("\n[1/3] Activating CAN bus...")
-    can_ok = activate_can_bus()
-    if can_ok:
-        print("  CAN bus: OK")
-    else:
-        print("  CAN bus: SKIPPED (demo mode)")
-
-    # Step 2: Connect and enable robot
-    print("\n[2/3] Connecting and enabling Piper robot...")
-    piper = connect_robot()
-    if piper:
-        print("  Robot: CONNECTED + ENABLED")
-    else:
-        print("  Robot: NOT CONNECTED (demo mode)")
+    # Steps 1 and 2: CAN bus activation, then connect and enable robot
+    # (both finish after the servers are up)
+    print("\n[1/3] Activating CAN bus in the background...")
+    print("\n[2/3] Connecting and enabling Piper robot in the background...")
 
     # Step 3: Start servers
     print(f"\n[3/3] Starting servers...")
@@ -925,7 +1045,12 @@ def main():
     print(f"  WebSocket: ws://{HOST}:{WS_PORT}")
     print("=" * 60)
 
-    server = PiperServer(piper)
+    server = PiperServer()
+
+    # uvloop is optional: a faster drop-in event loop for the WebSocket/HTTP servers
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        print("  Event loop: uvloop")
 
     try:
         asyncio.run(server.run())
@@ -461,7 +461,7 @@ class TimelineManager:
     
     def _estimate_recording_duration(self, recording_file: str) -> float:
         """
-        Estimate recording duration by reading the .ppr file.
+        Estimate recording duration from the cached recording summary.
         
         Args:
             recording_file: Path to .ppr file
@@ -469,46 +469,24 @@ class TimelineManager:
         Returns:
             Estimated duration in seconds
         """
-        try:
-            # Import here to avoid circular dependency
-            from ppr_file_handler import read_ppr_file
-            
-            # read_ppr_file returns (data_list, metadata) tuple
-            data, metadata = read_ppr_file(recording_file)
-            
-            if not data or len(data) < 2:
-                logger.warning(f"Recording has insufficient data: {recording_file}")
-                return 0.0
-            
-            # Get first and last timestamps
-            first_timestamp = data[0]['timestamp']
-            last_timestamp = data[-1]['timestamp']
-            
-            # Calculate raw difference
-            time_diff = last_timestamp - first_timestamp
-            
-            # Determine timestamp unit based on magnitude
-            # If difference > 1000, likely milliseconds or microseconds
-            # If difference < 100, likely seconds
-            if time_diff > 100000:
-                # Likely microseconds (time.time() * 1000000)
-                duration = time_diff / 1_000_000.0
-            elif time_diff > 1000:
-                # Likely milliseconds (time.time() * 1000)
-                duration = time_diff / 1000.0
-            else:
-                # Likely seconds
-                duration = time_diff
-            
-            logger.info(f"Recording duration: {duration:.2f}s ({len(data)} samples, time_diff={time_diff})")
-            return duration
-            
-        except Exception as e:
-            logger.warning(f"Could not read recording duration from {recording_file}: {e}")
-            import traceback
-            traceback.print_exc()
+        # Import here to avoid circular dependency
+        from ppr_file_handler import get_recording_info
+        
+        # Summary is cached by path/mtime/size, so the samples aren't re-parsed
+        info = get_recording_info(recording_file)
+        
+        if 'error' in info:
+            logger.warning(f"Could not read recording duration from {recording_file}: {info['error']}")
             # Return a default duration if we can't read the file
             return 10.0
+        
+        if info['sample_count'] < 2:
+            logger.warning(f"Recording has insufficient data: {recording_file}")
+            return 0.0
+        
+        duration = info['duration_sec']
+        logger.info(f"Recording duration: {duration:.2f}s ({info['sample_count']} samples)")
+        return duration
     
     def get_timeline_path(self, timeline_name: str) -> Path:
         """
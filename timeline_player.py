@@ -8,8 +8,6 @@ Timeline serves as a visual organizer for Program 1, Program 2, Program 3, etc.
 import time
 import logging
 from typing import Optional, Callable, Dict, Any
-from pathlib import Path
-import threading
 
 try:
     from piper_sdk import C_PiperInterface_V2
@@ -37,7 +35,7 @@ class TimelinePlayer:
     
     def __init__(
         self,
-        piper_interface: Optional[C_PiperInterface_V2],
+        piper_interface: Optional['C_PiperInterface_V2'],
         timeline: Timeline,
         global_speed: float = 1.0,
         on_progress: Optional[Callable[[float, str], None]] = None,
@@ -59,6 +57,9 @@ class TimelinePlayer:
         self.on_progress = on_progress
         self.on_complete = on_complete
         
+        # One player reused for every clip (created on first use)
+        self._player: Optional[PiperPlayer] = None
+        
         # Playback state
         self.is_playing = False
         self.should_stop = False
@@ -145,34 +146,38 @@ class TimelinePlayer:
         effective_speed = clip.speed_multiplier * self.global_speed
         self.logger.info(f"Playing clip: {clip.name} (speed: {effective_speed}x = {clip.speed_multiplier}x × {self.global_speed}x)")
         
-        # Load recording data
-        if not Path(clip.recording_file).exists():
-            self.logger.error(f"Recording file not found: {clip.recording_file}")
-            return
-        
         try:
-            # Create V1 player for this clip
-            player = PiperPlayer(self.piper)
-            
-            # Load the recording
-            player.load_recording(clip.recording_file)
+            # Reuse the V1 player; loading replaces the previous clip and trim
+            if self._player is None:
+                self._player = PiperPlayer(self.piper)
+            player = self._player
             
+            # Load the recording (a missing file raises FileNotFoundError)
+            try:
+                player.load_recording(clip.recording_file)
+            except FileNotFoundError:
+                self.logger.error(f"Recording file not found: {clip.recording_file}")
+                return
+
+            # Skip the trimmed portions of the recording
+            if clip.trim_start > 0 or clip.trim_end > 0:
+                player.set_trim(clip.trim_start, clip.trim_end)
+
             # Set speed (clip speed multiplied by global speed)
             player.set_speed(effective_speed)
             
             # Start playback
             player.start_playback()
             
-            # Wait for playback to complete
-            while player.is_playing():
+            # Wait for playback to complete, checking every 50ms
+            # (returns as soon as the clip ends rather than on the next tick)
+            while not player.wait_for_completion(0.05):
                 if self.should_stop:
-                    player.stop()
+                    player.stop_playback()
                     break
                 
                 # Update progress
-                progress_info = player.get_playback_info()
-                samples_played = progress_info.get('current_sample', 0)
-                total_samples = progress_info.get('total_samples', 1)
+                samples_played, total_samples = player.get_sample_position()
                 
                 if total_samples > 0:
                     clip_progress = samples_played / total_samples
@@ -180,8 +185,6 @@ class TimelinePlayer:
                     
                     if self.on_progress:
                         self.on_progress(self.current_position, clip.name)
-                
-                time.sleep(0.05)  # Check every 50ms
             
         except Exception as e:
             self.logger.error(f"Error playing clip {clip.name}: {e}")
@@ -199,20 +202,21 @@ class TimelinePlayer:
         self.logger.info(f"Playing gap: {duration:.2f}s")
         
         # Simply wait for the gap duration
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while (time.time() - start_time) < duration:
-            if self.should_stop:
+        while True:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= duration or self.should_stop:
                 break
             
             # Update progress during gap
-            elapsed = time.time() - start_time
             self.current_position = gap_start_time + elapsed
             
             if self.on_progress:
                 self.on_progress(self.current_position, "Gap (holding position)")
             
-            time.sleep(0.1)  # Update every 100ms
+            # Update every 100ms, but don't sleep past the end of the gap
+            time.sleep(min(0.1, duration - elapsed))
     
     def stop(self):
         """Stop playback."""
@@ -76,7 +76,8 @@ const el = {
     resetRobotBtn: document.getElementById('reset-robot-btn'),
     resetModal: document.getElementById('reset-modal'),
     resetConfirmBtn: document.getElementById('reset-confirm-btn'),
-    resetCancelBtn: document.getElementById('reset-cancel-btn')
+    resetCancelBtn: document.getElementById('reset-cancel-btn'),
+    joints: [0, 1, 2, 3, 4, 5].map(i => document.getElementById(`j${i}`))
 };
 
 // ============================================================
@@ -114,7 +115,7 @@ function connectWebSocket() {
 
         // Request initial data
         wsSend({ type: 'get_status' });
-        wsSend({ type: 'get_recordings' });
+        requestRecordings();
     };
 
     state.ws.onmessage = (event) => {
@@ -134,15 +135,19 @@ function connectWebSocket() {
         state.wsConnected = false;
         el.connIndicator.classList.remove('connected');
         el.connLabel.textContent = 'CAN Bus: Disconnected';
+        clearRecordingsLoading();  // No reply is coming on this socket
         log('Disconnected. Reconnecting in 3s...', 'warning');
         setTimeout(connectWebSocket, 3000);
     };
 }
 
+// Returns false if the socket isn't open and the message was dropped
 function wsSend(msg) {
     if (state.ws && state.ws.readyState === WebSocket.OPEN) {
         state.ws.send(JSON.stringify(msg));
+        return true;
     }
+    return false;
 }
 
 // ============================================================
@@ -189,31 +194,59 @@ function handleStatus(data) {
     state.robotConnected = data.connected;
     state.robotEnabled = data.enabled || data.sdk_available || false;
 
+    // Update recording/playing state from server
+    state.isRecording = data.recording || false;
+    state.isPlaying = data.playing || false;
+
+    scheduleRenderStatus(data);
+}
+
+// Status messages can arrive in bursts; only the latest one is drawn,
+// at most once per animation frame
+let pendingStatus = null;
+
+function scheduleRenderStatus(data) {
+    const alreadyScheduled = pendingStatus !== null;
+    pendingStatus = data;
+    if (alreadyScheduled) return;
+    requestAnimationFrame(() => {
+        const latest = pendingStatus;
+        pendingStatus = null;
+        renderStatus(latest);
+    });
+}
+
+// Most status messages repeat what is already on screen; skip DOM writes
+// that wouldn't change anything
+function setText(node, text) {
+    if (node && node.textContent !== text) node.textContent = text;
+}
+
+function setClass(node, className) {
+    if (node && node.className !== className) node.className = className;
+}
+
+function renderStatus(data) {
     // Update robot info display
     const connEl = el.robotConnected;
-    connEl.textContent = data.connected ? 'Yes' : 'No';
-    connEl.className = 'info-value ' + (data.connected ? 'yes' : 'no');
+    setText(connEl, data.connected ? 'Yes' : 'No');
+    setClass(connEl, 'info-value ' + (data.connected ? 'yes' : 'no'));
 
     const enEl = el.robotEnabled;
     const enabledVal = data.enabled || data.sdk_available || false;
-    enEl.textContent = enabledVal ? 'Yes' : 'No';
-    enEl.className = 'info-value ' + (enabledVal ? 'yes' : 'no');
+    setText(enEl, enabledVal ? 'Yes' : 'No');
+    setClass(enEl, 'info-value ' + (enabledVal ? 'yes' : 'no'));
 
     // State text
     let stateText = 'Idle';
     if (data.recording) stateText = 'Recording';
     else if (data.playing) stateText = 'Playing';
-    el.robotState.textContent = stateText;
-
-    // Update recording/playing state from server
-    state.isRecording = data.recording || false;
-    state.isPlaying = data.playing || false;
+    setText(el.robotState, stateText);
 
     // Joint angles
     if (data.joints && data.joints.length === 6) {
         for (let i = 0; i < 6; i++) {
-            const jel = document.getElementById(`j${i}`);
-            if (jel) jel.textContent = data.joints[i].toFixed(1);
+            setText(el.joints[i], data.joints[i].toFixed(1));
         }
     }
 
@@ -224,13 +257,66 @@ function handleStatus(data) {
     }
 }
 
+// Only dim the list if the server takes a noticeable time to answer, so
+// fast refreshes don't flicker
+const RECORDINGS_LOADING_DELAY_MS = 200;
+let recordingsLoadingTimer = null;
+
+function requestRecordings() {
+    if (!wsSend({ type: 'get_recordings' })) return;
+    if (recordingsLoadingTimer === null) {
+        recordingsLoadingTimer = setTimeout(() => {
+            el.recordingsList.classList.add('loading');
+        }, RECORDINGS_LOADING_DELAY_MS);
+    }
+}
+
+function clearRecordingsLoading() {
+    clearTimeout(recordingsLoadingTimer);
+    recordingsLoadingTimer = null;
+    el.recordingsList.classList.remove('loading');
+}
+
 function handleRecordingsList(data) {
-    state.recordings = data.recordings || [];
+    clearRecordingsLoading();
+
+    // Derive sort order and display strings once per list update, not per render
+    state.recordings = (data.recordings || [])
+        .map(prepareRecording)
+        .sort((a, b) => recordingNameCollator.compare(a.name, b.name));
     renderRecordingsList();
 }
 
+function prepareRecording(rec) {
+    const name = rec.name || '';
+    const dur = rec.duration_sec ?? rec.duration ?? null;
+    const samp = rec.sample_count ?? rec.samples ?? null;
+    const durationStr = dur != null ? `${dur.toFixed(1)}s` : '?';
+    const samplesStr = samp != null ? `${samp} samples` : '';
+
+    return {
+        name,
+        metaText: `${durationStr} ${samplesStr}`,
+        dragData: {
+            type: 'recording',
+            name,
+            duration_sec: dur || 0,
+            sample_count: samp || 0
+        }
+    };
+}
+
 function handleRecordingProgress(data) {
-    el.recInfo.textContent = `${data.samples} samples, ${data.duration.toFixed(1)}s, ${data.rate.toFixed(0)} Hz`;
+    setText(el.recInfo, `${data.samples} samples, ${data.duration.toFixed(1)}s, ${data.rate.toFixed(0)} Hz`);
+}
+
+// Node currently marked as executing, so progress messages for the same
+// node don't touch every node on the canvas
+let highlightedNodeId = null;
+
+function clearNodeHighlights() {
+    state.nodes.forEach(n => highlightNode(n.id, false));
+    highlightedNodeId = null;
 }
 
 function handlePlaybackProgress(data) {
@@ -241,8 +327,9 @@ function handlePlaybackProgress(data) {
     );
 
     // Highlight current node
-    if (data.current_node) {
+    if (data.current_node && data.current_node !== highlightedNodeId) {
         state.nodes.forEach(n => highlightNode(n.id, n.id === data.current_node));
+        highlightedNodeId = data.current_node;
     }
 
     // Update timer from progress
@@ -255,13 +342,8 @@ function handleTimelineComplete() {
     log('Timeline playback completed', 'success');
     updateExecutionStatus('Complete', '#4CAF50');
     stopTimer();
-    state.isPlaying = false;
-    state.isPaused = false;
-    el.playBtn.disabled = false;
-    el.stopBtn.disabled = true;
-    el.pauseBtn.disabled = true;
-    el.pauseBtn.innerHTML = '<span>&#10074;&#10074;</span> Pause';
-    state.nodes.forEach(n => highlightNode(n.id, false));
+    setPlaybackControls(false);
+    clearNodeHighlights();
 }
 
 function handleTimelinesList(data) {
@@ -303,45 +385,66 @@ function handleTimelineLoaded(data) {
 // ============================================================
 // Recordings Library
 // ============================================================
-function renderRecordingsList() {
-    el.recordingsList.innerHTML = '';
+// Shared collator: localeCompare() with options builds a new one per comparison
+const recordingNameCollator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+
+// Rendered list entries keyed by recording name: { item, meta, rec (drag payload) }
+const recordingItems = new Map();
+
+function createRecordingItem(name) {
+    const item = document.createElement('div');
+    item.className = 'recording-item';
+    item.draggable = true;
+
+    const nameDiv = document.createElement('div');
+    nameDiv.className = 'rec-name';
+    nameDiv.textContent = name;
+    const meta = document.createElement('div');
+    meta.className = 'rec-meta';
+    item.append(nameDiv, meta);
+
+    const entry = { item, meta, rec: null };
+    item.addEventListener('dragstart', (e) => {
+        e.dataTransfer.setData('application/json', JSON.stringify(entry.rec));
+    });
+    return entry;
+}
 
+function renderRecordingsList() {
     if (state.recordings.length === 0) {
+        recordingItems.clear();
         el.recordingsList.innerHTML = '<p class="waiting-message">No recordings found</p>';
         return;
     }
 
-    // Sort alphabetically
-    const sorted = [...state.recordings].sort((a, b) =>
-        (a.name || '').localeCompare(b.name || '', undefined, { numeric: true, sensitivity: 'base' })
-    );
+    el.recordingsList.querySelectorAll('.waiting-message').forEach(p => p.remove());
 
-    sorted.forEach(rec => {
-        const item = document.createElement('div');
-        item.className = 'recording-item';
-        item.draggable = true;
+    // Recordings are already sorted and formatted by handleRecordingsList.
+    // Update existing items in place; only create rows for new recordings
+    const seen = new Set();
+    state.recordings.forEach((rec, index) => {
+        let entry = recordingItems.get(rec.name);
+        if (!entry) {
+            entry = createRecordingItem(rec.name);
+            recordingItems.set(rec.name, entry);
+        }
+        seen.add(rec.name);
 
-        const dur = rec.duration_sec ?? rec.duration ?? null;
-        const samp = rec.sample_count ?? rec.samples ?? null;
-        const durationStr = dur != null ? `${dur.toFixed(1)}s` : '?';
-        const samplesStr = samp != null ? `${samp} samples` : '';
+        if (entry.meta.textContent !== rec.metaText) entry.meta.textContent = rec.metaText;
+        entry.rec = rec.dragData;
 
-        item.innerHTML = `
-            <div class="rec-name">${escapeHtml(rec.name)}</div>
-            <div class="rec-meta">${durationStr} ${samplesStr}</div>
-        `;
-
-        item.addEventListener('dragstart', (e) => {
-            e.dataTransfer.setData('application/json', JSON.stringify({
-                type: 'recording',
-                name: rec.name,
-                duration_sec: dur || 0,
-                sample_count: samp || 0
-            }));
-        });
-
-        el.recordingsList.appendChild(item);
+        // Only touch the DOM when the row isn't already in the right place
+        const current = el.recordingsList.children[index];
+        if (current !== entry.item) el.recordingsList.insertBefore(entry.item, current || null);
     });
+
+    // Drop rows for recordings that no longer exist
+    for (const [name, entry] of recordingItems) {
+        if (!seen.has(name)) {
+            entry.item.remove();
+            recordingItems.delete(name);
+        }
+    }
 }
 
 // ============================================================
@@ -364,13 +467,14 @@ el.recordBtn.addEventListener('click', () => {
         el.recordingStatus.style.display = 'none';
         log('Recording stopped', 'info');
 
-        // Refresh recordings list after short delay
-        setTimeout(() => wsSend({ type: 'get_recordings' }), 500);
+        // Refresh recordings list. The server handles one client's messages
+        // in order, so the new file is saved before this request is served.
+        requestRecordings();
     }
 });
 
 el.refreshRecordingsBtn.addEventListener('click', () => {
-    wsSend({ type: 'get_recordings' });
+    requestRecordings();
     log('Refreshing recordings...', 'info');
 });
 
@@ -431,31 +535,37 @@ function renderNode(node) {
         <div class="connection-point connection-output" data-node-id="${node.id}" data-type="output"></div>
     `;
 
-    // Event listeners
-    const header = nodeEl.querySelector('.node-header');
-    header.addEventListener('mousedown', (e) => handleNodeMouseDown(e, node));
+    getCanvasContainer().appendChild(nodeEl);
+}
 
-    nodeEl.querySelector('.speed-input').addEventListener('change', (e) => {
-        node.speed = parseFloat(e.target.value) || 1.0;
-    });
-    nodeEl.querySelector('.speed-input').addEventListener('mousedown', (e) => e.stopPropagation());
+// Node interaction is handled by listeners delegated from the canvas
+// container, so adding a node doesn't attach a set of closures of its own
+function nodeFromEvent(e) {
+    const nodeEl = e.target.closest('.node');
+    return nodeEl ? state.nodes.find(n => n.id === nodeEl.id) : null;
+}
 
-    nodeEl.querySelector('.delay-input').addEventListener('change', (e) => {
-        node.delayAfter = parseFloat(e.target.value) || 0;
+function attachNodeListeners(container) {
+    container.addEventListener('mousedown', (e) => {
+        const node = nodeFromEvent(e);
+        if (!node) return;
+
+        if (e.target.closest('.node-header')) {
+            handleNodeMouseDown(e, node);
+        } else if (e.target.closest('.connection-output')) {
+            e.stopPropagation();
+            state.isConnecting = true;
+            state.connectionStart = { node: node, type: 'output' };
+        } else if (e.target.closest('.speed-input, .delay-input, .node-remove')) {
+            e.stopPropagation();
+        }
     });
-    nodeEl.querySelector('.delay-input').addEventListener('mousedown', (e) => e.stopPropagation());
 
-    nodeEl.querySelector('.node-remove').addEventListener('click', () => removeNode(node.id));
-    nodeEl.querySelector('.node-remove').addEventListener('mousedown', (e) => e.stopPropagation());
-
-    // Connection points
-    nodeEl.querySelector('.connection-output').addEventListener('mousedown', (e) => {
-        e.stopPropagation();
-        state.isConnecting = true;
-        state.connectionStart = { node: node, type: 'output' };
-    });
+    container.addEventListener('mouseup', (e) => {
+        if (!e.target.closest('.connection-input')) return;
+        const node = nodeFromEvent(e);
+        if (!node) return;
 
-    nodeEl.querySelector('.connection-input').addEventListener('mouseup', (e) => {
         e.stopPropagation();
         if (state.isConnecting && state.connectionStart) {
             const from = state.connectionStart.node;
@@ -474,12 +584,28 @@ function renderNode(node) {
         state.connectionStart = null;
     });
 
-    // Click to select
-    nodeEl.addEventListener('click', (e) => {
-        if (!state.isDragging) selectNode(node.id);
+    container.addEventListener('change', (e) => {
+        const node = nodeFromEvent(e);
+        if (!node) return;
+
+        if (e.target.classList.contains('speed-input')) {
+            node.speed = parseFloat(e.target.value) || 1.0;
+        } else if (e.target.classList.contains('delay-input')) {
+            node.delayAfter = parseFloat(e.target.value) || 0;
+        }
     });
 
-    getCanvasContainer().appendChild(nodeEl);
+    container.addEventListener('click', (e) => {
+        const node = nodeFromEvent(e);
+        if (!node) return;
+
+        if (e.target.closest('.node-remove')) {
+            removeNode(node.id);
+        } else if (!state.isDragging) {
+            // Click to select
+            selectNode(node.id);
+        }
+    });
 }
 
 function removeNode(nodeId) {
@@ -523,7 +649,7 @@ function updateNodePosition(node, x, y) {
         element.style.left = `${x}px`;
         element.style.top = `${y}px`;
     }
-    renderAllConnections();
+    scheduleRenderConnections();
 }
 
 function highlightNode(nodeId, highlight) {
@@ -568,46 +694,77 @@ function wouldCreateCircularDependency(fromId, toId) {
     return dependsOn(fromId, toId);
 }
 
-function renderAllConnections() {
+// Coalesce redraws requested by mousemove (which can fire several times per
+// frame while dragging) into one renderAllConnections() per animation frame
+let connectionsRenderPending = false;
+
+function scheduleRenderConnections() {
+    if (connectionsRenderPending) return;
+    connectionsRenderPending = true;
+    requestAnimationFrame(() => {
+        connectionsRenderPending = false;
+        renderAllConnections();
+    });
+}
+
+// The connections SVG (with its arrowhead marker) and one path per
+// connection are created once and reused; redraws only update 'd'
+const SVG_NS = 'http://www.w3.org/2000/svg';
+let connectionsSvg = null;
+const connectionPaths = [];
+
+function getConnectionsSvg() {
+    if (!connectionsSvg) {
+        const svg = document.createElementNS(SVG_NS, 'svg');
+        svg.classList.add('connections-svg');
+
+        // Arrowhead marker
+        const defs = document.createElementNS(SVG_NS, 'defs');
+        const marker = document.createElementNS(SVG_NS, 'marker');
+        marker.setAttribute('id', 'arrowhead');
+        marker.setAttribute('markerWidth', '10');
+        marker.setAttribute('markerHeight', '10');
+        marker.setAttribute('refX', '9');
+        marker.setAttribute('refY', '3');
+        marker.setAttribute('orient', 'auto');
+        marker.setAttribute('markerUnits', 'strokeWidth');
+
+        const polygon = document.createElementNS(SVG_NS, 'polygon');
+        polygon.setAttribute('points', '0 0, 10 3, 0 6');
+        polygon.setAttribute('fill', '#f0883e');
+
+        marker.appendChild(polygon);
+        defs.appendChild(marker);
+        svg.appendChild(defs);
+        connectionsSvg = svg;
+    }
+
     const container = getCanvasContainer();
-    const existing = container.querySelector('.connections-svg');
-    if (existing) existing.remove();
-
-    if (state.connections.length === 0) return;
-
-    const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
-    svg.classList.add('connections-svg');
-    svg.style.position = 'absolute';
-    svg.style.top = '0';
-    svg.style.left = '0';
-    svg.style.width = '100%';
-    svg.style.height = '100%';
-    svg.style.pointerEvents = 'none';
-    svg.style.zIndex = '1';
-    svg.style.overflow = 'visible';
-
-    // Arrowhead marker
-    const defs = document.createElementNS('http://www.w3.org/2000/svg', 'defs');
-    const marker = document.createElementNS('http://www.w3.org/2000/svg', 'marker');
-    marker.setAttribute('id', 'arrowhead');
-    marker.setAttribute('markerWidth', '10');
-    marker.setAttribute('markerHeight', '10');
-    marker.setAttribute('refX', '9');
-    marker.setAttribute('refY', '3');
-    marker.setAttribute('orient', 'auto');
-    marker.setAttribute('markerUnits', 'strokeWidth');
-
-    const polygon = document.createElementNS('http://www.w3.org/2000/svg', 'polygon');
-    polygon.setAttribute('points', '0 0, 10 3, 0 6');
-    polygon.setAttribute('fill', '#f0883e');
-
-    marker.appendChild(polygon);
-    defs.appendChild(marker);
-    svg.appendChild(defs);
+    if (connectionsSvg.parentNode !== container) {
+        container.insertBefore(connectionsSvg, container.firstChild);
+    }
+    return connectionsSvg;
+}
+
+function createConnectionPath() {
+    const path = document.createElementNS(SVG_NS, 'path');
+    path.setAttribute('stroke', '#f0883e');
+    path.setAttribute('stroke-width', '3');
+    path.setAttribute('fill', 'none');
+    path.setAttribute('marker-end', 'url(#arrowhead)');
+    return path;
+}
+
+function renderAllConnections() {
+    const svg = getConnectionsSvg();
 
+    // Index nodes once per render instead of scanning the list per connection
+    const nodesById = new Map(state.nodes.map(n => [n.id, n]));
+
+    let count = 0;
     state.connections.forEach(conn => {
-        const fromNode = state.nodes.find(n => n.id === conn.fromNode);
-        const toNode = state.nodes.find(n => n.id === conn.toNode);
+        const fromNode = nodesById.get(conn.fromNode);
+        const toNode = nodesById.get(conn.toNode);
         if (!fromNode || !toNode) return;
 
         const fromX = fromNode.x + fromNode.width;
@@ -618,16 +775,19 @@ function renderAllConnections() {
         const midX = (fromX + toX) / 2;
         const d = `M ${fromX} ${fromY} C ${midX} ${fromY}, ${midX} ${toY}, ${toX} ${toY}`;
 
-        const path = document.createElementNS('http://www.w3.org/2000/svg', 'path');
-        path.setAttribute('d', d);
-        path.setAttribute('stroke', '#f0883e');
-        path.setAttribute('stroke-width', '3');
-        path.setAttribute('fill', 'none');
-        path.setAttribute('marker-end', 'url(#arrowhead)');
-        svg.appendChild(path);
+        if (count === connectionPaths.length) {
+            const path = createConnectionPath();
+            svg.appendChild(path);
+            connectionPaths.push(path);
+        }
+        connectionPaths[count].setAttribute('d', d);
+        count++;
     });
 
-    container.insertBefore(svg, container.firstChild);
+    // Drop paths left over from removed connections
+    while (connectionPaths.length > count) {
+        connectionPaths.pop().remove();
+    }
 }
 
 // ============================================================
@@ -638,11 +798,7 @@ function getCanvasContainer() {
     if (!container) {
         container = document.createElement('div');
         container.className = 'canvas-container';
-        container.style.position = 'absolute';
-        container.style.transformOrigin = '0 0';
-        container.style.width = '100%';
-        container.style.height = '100%';
-        container.style.pointerEvents = 'none';
+        attachNodeListeners(container);
         el.nodeEditor.appendChild(container);
     }
     return container;
@@ -651,7 +807,8 @@ function getCanvasContainer() {
 function updateCanvasTransform() {
     const container = getCanvasContainer();
     container.style.transform = `translate(${state.panOffset.x}px, ${state.panOffset.y}px) scale(${state.scale})`;
-    renderAllConnections();
+    // Connections live inside the transformed container, so pan/zoom
+    // doesn't need to redraw them
 }
 
 function updateZoomDisplay() {
@@ -757,6 +914,21 @@ document.addEventListener('mouseup', () => {
 // ============================================================
 // Playback Controls
 // ============================================================
+const PAUSE_BUTTON_HTML = '<span>&#10074;&#10074;</span> Pause';
+const RESUME_BUTTON_HTML = '<span>&#9654;</span> Resume';
+
+// Apply one playing/stopped transition to the state and all three buttons
+function setPlaybackControls(playing) {
+    const wasPaused = state.isPaused;
+    state.isPlaying = playing;
+    state.isPaused = false;
+    el.playBtn.disabled = playing;
+    el.stopBtn.disabled = !playing;
+    el.pauseBtn.disabled = !playing;
+    // Only re-render the pause label if it currently says "Resume"
+    if (wasPaused) el.pauseBtn.innerHTML = PAUSE_BUTTON_HTML;
+}
+
 el.playBtn.addEventListener('click', () => {
     if (state.nodes.length === 0) {
         log('No nodes on canvas', 'warning');
@@ -774,11 +946,7 @@ el.playBtn.addEventListener('click', () => {
         loopDelay: parseFloat(el.loopDelay.value) || 0
     });
 
-    state.isPlaying = true;
-    state.isPaused = false;
-    el.playBtn.disabled = true;
-    el.stopBtn.disabled = false;
-    el.pauseBtn.disabled = false;
+    setPlaybackControls(true);
     updateExecutionStatus('Playing', '#FFC107');
     startTimer();
     log('Timeline playback started', 'info');
@@ -786,15 +954,10 @@ el.playBtn.addEventListener('click', () => {
 
 el.stopBtn.addEventListener('click', () => {
     wsSend({ type: 'stop_playback' });
-    state.isPlaying = false;
-    state.isPaused = false;
-    el.playBtn.disabled = false;
-    el.stopBtn.disabled = true;
-    el.pauseBtn.disabled = true;
-    el.pauseBtn.innerHTML = '<span>&#10074;&#10074;</span> Pause';
+    setPlaybackControls(false);
     updateExecutionStatus('Stopped', '#f44336');
     stopTimer();
-    state.nodes.forEach(n => highlightNode(n.id, false));
+    clearNodeHighlights();
     log('Playback stopped', 'warning');
 });
 
@@ -802,13 +965,13 @@ el.pauseBtn.addEventListener('click', () => {
     if (!state.isPaused) {
         wsSend({ type: 'pause_playback' });
         state.isPaused = true;
-        el.pauseBtn.innerHTML = '<span>&#9654;</span> Resume';
+        el.pauseBtn.innerHTML = RESUME_BUTTON_HTML;
         updateExecutionStatus('Paused', '#b08800');
         log('Playback paused', 'info');
     } else {
         wsSend({ type: 'resume_playback' });
         state.isPaused = false;
-        el.pauseBtn.innerHTML = '<span>&#10074;&#10074;</span> Pause';
+        el.pauseBtn.innerHTML = PAUSE_BUTTON_HTML;
         updateExecutionStatus('Playing', '#FFC107');
         log('Playback resumed', 'info');
     }
@@ -1009,7 +1172,13 @@ function updateTimerDisplay() {
     el.timer.textContent = `${String(h).padStart(2, '0')}:${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')}`;
 }
 
+// Progress messages repeat the same status many times a second
+let lastExecutionStatus = null;
+
 function updateExecutionStatus(text, color) {
+    const key = `${text}|${color}`;
+    if (key === lastExecutionStatus) return;
+    lastExecutionStatus = key;
     el.executionStatus.textContent = text;
     el.executionStatus.style.background = color;
     el.executionStatus.style.color = 'white';